@@ -29,10 +29,11 @@ def cli():
 @click.option('--tesseract-cmd', default=None, help='Path to tesseract executable')
 @click.option('--apply-exclusions/--ignore-exclusions', default=True, show_default=True,
               help='Apply path exclusion patterns from the database')
+@click.option('--workers', '-w', default=None, type=int, help='Number of extraction worker processes (default: CPU count)')
 @click.option('--log-file', default='app.log', show_default=True, help='Log file path')
 @click.option('--log-level', default='INFO', show_default=True, type=click.Choice(['DEBUG','INFO','WARNING','ERROR','CRITICAL'], case_sensitive=False))
 def add_tag_files(
-    tag, mount, number, randomize, exclude_embedded, max_size_mb, threshold, tesseract_cmd, apply_exclusions, log_file, log_level
+    tag, mount, number, randomize, exclude_embedded, max_size_mb, threshold, tesseract_cmd, apply_exclusions, workers, log_file, log_level
 ):
     """
     CLI tool to process and embed files for a given filing tag
@@ -63,7 +64,8 @@ def add_tag_files(
         max_size_mb=max_size_mb,
         text_length_threshold=threshold,
         tesseract_cmd=tesseract_cmd,
-        apply_exclusions=apply_exclusions
+        apply_exclusions=apply_exclusions,
+        max_workers=workers
     )
     cli_logger.info("Completed add_files processing.")
 
@@ -77,10 +79,11 @@ def add_tag_files(
 @click.option('--tesseract-cmd', default=None, help='Path to tesseract executable')
 @click.option('--apply-exclusions/--ignore-exclusions', default=True, show_default=True,
               help='Apply path exclusion patterns from the database')
+@click.option('--workers', '-w', default=None, type=int, help='Number of extraction worker processes (default: CPU count)')
 @click.option('--log-file', default='app.log', show_default=True, help='Log file path')
 @click.option('--log-level', default='INFO', show_default=True, type=click.Choice(['DEBUG','INFO','WARNING','ERROR','CRITICAL'], case_sensitive=False))
 def add_location_files(
-    location, mount, number, exclude_embedded, max_size_mb, threshold, tesseract_cmd, apply_exclusions, log_file, log_level
+    location, mount, number, exclude_embedded, max_size_mb, threshold, tesseract_cmd, apply_exclusions, workers, log_file, log_level
 ):
     """
     CLI tool to process and embed files for a given server location
@@ -113,7 +116,8 @@ def add_location_files(
         max_size_mb=max_size_mb,
         text_length_threshold=threshold,
         tesseract_cmd=tesseract_cmd,
-        apply_exclusions=apply_exclusions
+        apply_exclusions=apply_exclusions,
+        max_workers=workers
     )
     cli_logger.info("Completed add_files processing.")
 
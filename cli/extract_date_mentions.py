@@ -17,10 +17,11 @@ from logging_setups import setup_logger
 @click.option('--mount', '-m', required=True, help='Base mount path for the file server')
 @click.option('--limit', '-n', type=int, default=None, help='Maximum number of files to process')
 @click.option('--random/--no-random', default=False, show_default=True, help='Process files in random order')
+@click.option('--workers', '-w', default=None, type=int, help='Number of date extraction worker processes (default: CPU count)')
 @click.option('--log-file', default='app.log', show_default=True, help='Log file path')
 @click.option('--log-level', default='INFO', show_default=True, 
               type=click.Choice(['DEBUG','INFO','WARNING','ERROR','CRITICAL'], case_sensitive=False))
-def extract_dates(path, mount, limit, random, log_file, log_level):
+def extract_dates(path, mount, limit, random, workers, log_file, log_level):
     """
     CLI tool to extract date mentions from documents in a specified server path.
 
@@ -61,7 +62,8 @@ def extract_dates(path, mount, limit, random, log_file, log_level):
             server_location=path,
             mount=mount,
             limit=limit,
-            randomize=random
+            randomize=random,
+            max_workers=workers
         )
         
         cli_logger.info(f"Successfully processed {files_processed} files")
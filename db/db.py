@@ -8,6 +8,7 @@ import os
 import subprocess
 import bz2
 from datetime import datetime
+from functools import cache
 from sqlalchemy import create_engine
 
 # Configure basic logging for database interactions
@@ -19,14 +20,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@cache
 def get_db_engine():
-    """Create and return a SQLAlchemy engine for the project database."""
+    """
+    Return the SQLAlchemy engine for the project database.
+
+    The engine (and so its connection pool) is created once per process and
+    shared by every caller, so repeated pipeline runs reuse open connections
+    instead of paying a fresh connect + auth handshake each time. Connections
+    are pinged on checkout, so ones dropped by the server while idle are
+    replaced transparently.
+    """
     conn_string = (
         f"postgresql+psycopg://{os.getenv('PROJECT_DB_USERNAME')}:{os.getenv('PROJECT_DB_PASSWORD')}"
         f"@{os.getenv('PROJECT_DB_HOST')}:{os.getenv('PROJECT_DB_PORT')}/{os.getenv('PROJECT_DB_NAME')}"
     )
     logger.info("Creating database engine")
-    return create_engine(conn_string)
+    return create_engine(conn_string, pool_size=25, max_overflow=10, pool_pre_ping=True)
 
 
 def backup_database(backup_dir: str, compress: bool = False) -> str:
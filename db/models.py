@@ -4,12 +4,14 @@ import logging
 import os
 import fnmatch
 import re
+import numpy as np
 from pathlib import Path, PurePosixPath
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, BigInteger, Text, Boolean, Numeric, Index, Date, or_
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, BigInteger, Text, Boolean, Numeric, Index, Date, LargeBinary, and_, literal_column, or_, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,21 @@ Base = declarative_base()
 
 # get_db_engine moved to db/db.py
 
+class HalfVecArray(TypeDecorator):
+    """
+    pgvector halfvec column that reads back as a float32 numpy array.
+
+    Plain HALFVEC returns pgvector.HalfVector objects, which np.array() /
+    np.stack() don't unpack; this keeps reads looking like the old Vector
+    column's while storage stays fp16.
+    """
+    impl = HALFVEC
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else value.to_numpy().astype(np.float32)
+
+
 class File(Base):
     __tablename__ = 'files'
     id = Column(Integer, primary_key=True)
@@ -39,6 +56,18 @@ class File(Base):
 
 class FileLocation(Base):
     __tablename__ = 'file_locations'
+    # create_all only builds these on new tables; on an existing database run:
+    #   CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    #   CREATE INDEX CONCURRENTLY ix_file_locations_dirs_trgm ON file_locations
+    #       USING gin (lower(file_server_directories) gin_trgm_ops);
+    #   CREATE INDEX CONCURRENTLY ix_file_locations_dirs_pattern ON file_locations
+    #       (file_server_directories varchar_pattern_ops);
+    __table_args__ = (
+        # substring matches on lower(dirs) (tag lookups); requires the pg_trgm extension
+        Index('ix_file_locations_dirs_trgm', text('lower(file_server_directories) gin_trgm_ops'), postgresql_using='gin'),
+        # prefix matches (equality / startswith on a server directory)
+        Index('ix_file_locations_dirs_pattern', 'file_server_directories', postgresql_ops={'file_server_directories': 'varchar_pattern_ops'}),
+    )
     id = Column(Integer, primary_key=True)
     file_id = Column(Integer, ForeignKey('files.id'), nullable=False)
     existence_confirmed = Column(DateTime(timezone=True))
@@ -105,20 +134,47 @@ class FileContent(Base):
     Previously named FileEmbedding (renamed for clarity).
     """
     __tablename__ = 'file_contents'
+    # create_all only builds these on a new table; on an existing database run:
+    #   ALTER TABLE file_contents ALTER COLUMN minilm_emb TYPE halfvec(384);
+    #   DROP INDEX ix_file_contents_minilm_emb;
+    #   CREATE INDEX CONCURRENTLY ix_file_contents_minilm_emb ON file_contents
+    #       USING ivfflat (minilm_emb halfvec_cosine_ops) WITH (lists = 100);
+    #   ALTER TABLE file_contents ADD COLUMN source_text_hash bytea;
+    #   CREATE INDEX CONCURRENTLY ix_file_contents_source_text_hash ON file_contents (source_text_hash);
     __table_args__ = (
-        Index('ix_file_contents_minilm_emb', 'minilm_emb', postgresql_using='ivfflat', postgresql_ops={'minilm_emb': 'vector_cosine_ops'}, postgresql_with={'lists': 100}),
+        Index('ix_file_contents_minilm_emb', 'minilm_emb', postgresql_using='ivfflat', postgresql_ops={'minilm_emb': 'halfvec_cosine_ops'}, postgresql_with={'lists': 100}),
         Index('ix_file_contents_mpnet_emb', 'mpnet_emb', postgresql_using='ivfflat', postgresql_ops={'mpnet_emb': 'vector_cosine_ops'}, postgresql_with={'lists': 100}),
+        Index('ix_file_contents_source_text_hash', 'source_text_hash'),
+        # rows with usable text. The WHERE clause and FileContent.has_text() must stay
+        # identical, or the planner won't use this index. On an existing database:
+        #   CREATE INDEX CONCURRENTLY ix_file_contents_has_text ON file_contents (file_hash)
+        #       WHERE source_text IS NOT NULL AND length(source_text) > 0;
+        Index('ix_file_contents_has_text', 'file_hash', postgresql_where=text("source_text IS NOT NULL AND length(source_text) > 0")),
     )
     file_hash = Column(String, ForeignKey('files.hash'), primary_key=True)
     source_text = Column(Text)
+    source_text_hash = Column(LargeBinary, comment="blake2b-128 digest of source_text; files with identical text share one embedding.")
     text_length = Column(Integer, comment="Length of the extracted text in characters.")
     minilm_model = Column(Text)
-    minilm_emb = Column(Vector(384))
+    # fp16 (pgvector halfvec): half the storage and transfer of vector(384), ample precision for cosine search
+    minilm_emb = Column(HalfVecArray(384))
     mpnet_model = Column(Text)
     mpnet_emb = Column(Vector(768))
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     file = relationship("File", back_populates="content", foreign_keys=[file_hash])
 
+    @classmethod
+    def has_text(cls):
+        """
+        Predicate for rows with non-empty source_text.
+
+        Mirrors the WHERE clause of ix_file_contents_has_text; change both together
+        or the planner stops using the index. The 0 is rendered
+        inline rather than bound so generic (prepared) plans can still prove the
+        partial index applies.
+        """
+        return and_(cls.source_text.isnot(None), func.length(cls.source_text) > literal_column('0'))
+
 
 class FileCollection(Base):
     __tablename__ = 'file_collections'
@@ -1,6 +1,6 @@
 # knn/__init__.py
 
-from .evaluation import KNNCollectionProvenance
+from .base import KNNCollectionProvenance
 from .evaluation import SplitSelectionStrategy, NeighborFilterStrategy, LabelingStrategy, KNNRun
 
 __all__ = [
@@ -1,6 +1,40 @@
 # knn/base.py
 
+import math
 import numpy as np
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from numba import njit, prange  # optional JIT kernel for small batches
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# below this many rows the fused numba kernel beats BLAS GEMV + masking
+_NUMBA_MAX_ROWS = 1024
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _cosine_similarity_batch_jit(query_vec, matrix, query_norm):
+        """
+        Fused row-norm + dot product kernel for cosine_similarity_batch.
+
+        Compiled without fastmath, so IEEE semantics hold and results match the
+        NumPy path to rounding. Shapes are checked by the caller; the kernel
+        doesn't bounds-check.
+        """
+        n, d = matrix.shape
+        out = np.empty(n)
+        for i in prange(n):
+            dot = 0.0
+            row_norm2 = 0.0
+            for j in range(d):
+                dot += matrix[i, j] * query_vec[j]
+                row_norm2 += matrix[i, j] * matrix[i, j]
+            out[i] = 0.0 if row_norm2 == 0.0 else dot / (math.sqrt(row_norm2) * query_norm)
+        return out
 
 
 def cosine_similarity(a, b):
@@ -10,11 +44,12 @@ def cosine_similarity(a, b):
     """
     a = np.asarray(a, dtype=float)
     b = np.asarray(b, dtype=float)
-    na = np.linalg.norm(a)
-    nb = np.linalg.norm(b)
-    if na == 0.0 or nb == 0.0:
+    # squared norms via dot products; a single sqrt at the end
+    na2 = float(np.dot(a, a))
+    nb2 = float(np.dot(b, b))
+    if na2 == 0.0 or nb2 == 0.0:
         return 0.0
-    return float(np.dot(a, b) / (na * nb))
+    return float(np.dot(a, b)) / math.sqrt(na2 * nb2)
 
 def cosine_similarity_batch(query_vec, matrix):
     """
@@ -31,15 +66,34 @@ def cosine_similarity_batch(query_vec, matrix):
     -------
     np.ndarray, shape (n,)
         Cosine similarities between query_vec and each row of matrix
+
+    Raises
+    ------
+    ValueError
+        If query_vec and the rows of matrix differ in dimension
+
+    Notes
+    -----
+    When numba is installed, matrices with fewer than 1024 rows go through a
+    JIT-compiled kernel; larger ones use the NumPy/BLAS path.
     """
     query_vec = np.asarray(query_vec, dtype=float)
     matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim == 2 and query_vec.shape[-1] != matrix.shape[1]:
+        raise ValueError(
+            f"query vector has {query_vec.shape[-1]} dimensions but matrix rows have {matrix.shape[1]}"
+        )
 
     # Normalize query vector
     query_norm = np.linalg.norm(query_vec)
     if query_norm == 0.0:
         return np.zeros(matrix.shape[0])
 
+    if _HAS_NUMBA and matrix.ndim == 2 and matrix.shape[0] < _NUMBA_MAX_ROWS:
+        return _cosine_similarity_batch_jit(
+            np.ascontiguousarray(query_vec), np.ascontiguousarray(matrix), query_norm
+        )
+
     # Normalize matrix rows
     matrix_norms = np.linalg.norm(matrix, axis=1)
     zero_mask = matrix_norms == 0.0
@@ -52,4 +106,73 @@ def cosine_similarity_batch(query_vec, matrix):
     valid_mask = ~zero_mask
     sims[valid_mask] = dots[valid_mask] / (matrix_norms[valid_mask] * query_norm)
 
-    return sims
\ No newline at end of file
+    return sims
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with a 'Z' suffix."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+@dataclass(slots=True, frozen=True)
+class KNNCollectionProvenance:
+    """
+    Describes the setup context for a set of FileCollections used in a KNN evaluation run.
+    Intended for storage in FileCollection.meta.
+
+    Instances are immutable and hashable; ``parents`` is stored as a tuple.
+    """
+    purpose: str
+    split_strategy: str
+    embedding_column: str
+    parents: Tuple[str, ...]
+    split_ratio: float
+    random_seed: Optional[int] = None
+    # dicts are unhashable, so extra_params is left out of __hash__
+    extra_params: Dict[str, Any] = field(default_factory=dict, hash=False)
+    created_utc: str = field(default_factory=_utc_timestamp)
+
+    def __post_init__(self):
+        if not isinstance(self.parents, tuple):
+            object.__setattr__(self, "parents", tuple(self.parents))
+
+    _DESC_TEMPLATE = (
+        "# Collection purpose\n"
+        "{purpose}\n"
+        "\n"
+        "# Creation details\n"
+        "- Created: {created_utc}\n"
+        "- Split strategy: {split_strategy}\n"
+        "- Embedding column: {embedding_column}\n"
+        "- Parent tags: {parents}\n"
+        "- Train/Test split: {train_pct}/{test_pct}\n"
+        "- Random seed: {random_seed}\n"
+        "\n"
+        "# Notes\n"
+        "{notes}\n"
+    )
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Return dict suitable for FileCollection.meta"""
+        # fields are immutable (parents is a tuple), so a shallow copy is enough;
+        # this avoids asdict()'s recursive deepcopy
+        provenance = {f.name: getattr(self, f.name) for f in fields(self)}
+        provenance["extra_params"] = dict(self.extra_params)
+        return {
+            "provenance": provenance,
+            "counts": {},  # will be populated later
+        }
+
+    def to_description(self) -> str:
+        train_pct = int(self.split_ratio * 100)
+        return self._DESC_TEMPLATE.format_map({
+            "purpose": self.purpose,
+            "created_utc": self.created_utc,
+            "split_strategy": self.split_strategy,
+            "embedding_column": self.embedding_column,
+            "parents": ", ".join(self.parents),
+            "train_pct": train_pct,
+            "test_pct": 100 - train_pct,
+            "random_seed": self.random_seed or "None",
+            "notes": self.extra_params.get("notes", "") if self.extra_params else "",
+        })
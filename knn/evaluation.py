@@ -2,53 +2,12 @@
 
 
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
 from sqlalchemy.orm import Session
-from typing import Any, Dict, List, Tuple, Optional
+from typing import List, Tuple
 
 from db.models import FileCollection
-
-
-@dataclass
-class KNNCollectionProvenance:
-    """
-    Describes the setup context for a set of FileCollections used in a KNN evaluation run.
-    Intended for storage in FileCollection.meta.
-    """
-    purpose: str
-    split_strategy: str
-    embedding_column: str
-    parents: List[str]
-    split_ratio: float
-    random_seed: Optional[int] = None
-    extra_params: Dict[str, Any] = field(default_factory=dict)
-    created_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
-
-    def to_metadata(self) -> Dict[str, Any]:
-        """Return dict suitable for FileCollection.meta"""
-        return {
-            "provenance": asdict(self),
-            "counts": {},  # will be populated later
-        }
-
-    def to_description(self) -> str:
-        train_pct = int(self.split_ratio * 100)
-        test_pct = 100 - train_pct
-        return f"""# Collection purpose
-{self.purpose}
-
-# Creation details
-- Created: {self.created_utc}
-- Split strategy: {self.split_strategy}
-- Embedding column: {self.embedding_column}
-- Parent tags: {', '.join(self.parents)}
-- Train/Test split: {train_pct}/{test_pct}
-- Random seed: {self.random_seed or 'None'}
-
-# Notes
-{self.extra_params.get('notes', '') if self.extra_params else ''}
-"""
+from .base import KNNCollectionProvenance
 
 
 class SplitSelectionStrategy(ABC):
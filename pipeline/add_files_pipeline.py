@@ -1,49 +1,137 @@
 # pipeline/add_files_pipeline.py
 
+import hashlib
 import logging
+import mmap
+import multiprocessing as mp
 import os
 import shutil
 import tempfile
 import traceback
+import numpy as np
 import pytesseract
+from itertools import batched
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 from db.models import File, FileLocation, FilingTag, FileTagLabel, FileContent
 from db import get_db_engine
+from embedding.base import dequantize_int8, quantize_int8
 from embedding.minilm import MiniLMEmbedder
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
-from text_extraction.pdf_extraction import PDFTextExtractor
-from text_extraction.basic_extraction import TextFileTextExtractor, TikaTextExtractor, get_extractor_for_file
+from sqlalchemy import func, inspect, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+from text_extraction.pdf_extraction import DEFAULT_OCR_CONCURRENCY, PDFTextExtractor
+from text_extraction.basic_extraction import FileTextExtractor, TextFileTextExtractor, TikaTextExtractor
 from text_extraction.image_extraction import ImageTextExtractor
 from text_extraction.office_doc_extraction import PresentationTextExtractor, SpreadsheetTextExtractor, WordFileTextExtractor
 from text_extraction.web_extraction import HtmlTextExtractor, EmailTextExtractor
-from text_extraction.extraction_utils import common_char_replacements, strip_diacritics, normalize_unicode, normalize_whitespace
+from text_extraction.extraction_utils import clean_text
 from utils import extract_server_dirs
 
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+try:
+    import diskcache  # optional on-disk embedding cache
+    _HAS_DISKCACHE = True
+except ImportError:
+    _HAS_DISKCACHE = False
+
 DEFAULT_MAX_SIZE_MB = 200
 DEFAULT_TEXT_LENGTH_THRESHOLD = 250
+EMBED_BATCH_SIZE = 32
+# Files located and submitted for extraction per round; bounds how many ORM rows are held at once
+FILE_CHUNK_SIZE = 256
+# Files above this size are extracted in their own small pool so long OCR/Tika runs don't stall the rest
+FAST_PATH_MAX_MB = 20
+SLOW_POOL_WORKERS = 2
+# Threads stat'ing candidate locations while files are located; stats on network mounts are round-trips
+STAT_WORKERS = 32
+# Random sampling fetches this many candidate ids per wanted file (the join repeats
+# files with several matching locations)
+SAMPLE_OVERFETCH = 10
+# MiniLM truncates to 256 word pieces; tokenizing more text than this is wasted work
+MAX_EMBED_CHARS = 4096
+EMBED_CACHE_DIR = os.environ.get(
+    'EMBED_CACHE_DIR', str(Path.home() / '.cache' / 'file_code_tagger' / 'emb'))
+
+class _Extractors:
+    """
+    Text extractors, each built on first use.
+
+    Constructing an extractor can be costly (the Tika extractor pings its
+    server, the OCR/COM extractors load libraries), so each worker process only
+    builds the ones for file types it actually sees.
+    """
+    # extractor attribute names in priority order; the first one claiming an extension wins
+    _ORDER = ('pdf', 'txt', 'image', 'presentation', 'spreadsheet', 'word', 'html', 'email')
+    _CLASSES = {
+        'pdf': PDFTextExtractor,
+        'txt': TextFileTextExtractor,
+        'image': ImageTextExtractor,
+        'presentation': PresentationTextExtractor,
+        'spreadsheet': SpreadsheetTextExtractor,
+        'word': WordFileTextExtractor,
+        'html': HtmlTextExtractor,
+        'email': EmailTextExtractor,
+    }
+
+    def __init__(self):
+        self._by_extension = {}
+        for name in self._ORDER:
+            for ext in self._CLASSES[name].file_extensions:
+                self._by_extension.setdefault(ext, name)
+
+    @cached_property
+    def pdf(self) -> PDFTextExtractor:
+        return PDFTextExtractor()
+
+    @cached_property
+    def txt(self) -> TextFileTextExtractor:
+        return TextFileTextExtractor()
+
+    @cached_property
+    def image(self) -> ImageTextExtractor:
+        return ImageTextExtractor()
+
+    @cached_property
+    def presentation(self) -> PresentationTextExtractor:
+        return PresentationTextExtractor()
+
+    @cached_property
+    def spreadsheet(self) -> SpreadsheetTextExtractor:
+        return SpreadsheetTextExtractor()
+
+    @cached_property
+    def word(self) -> WordFileTextExtractor:
+        return WordFileTextExtractor()
 
-# Initialize extractors and Tika fallback
-pdf_extractor = PDFTextExtractor()
-txt_extractor = TextFileTextExtractor()
-image_extractor = ImageTextExtractor()
-presentation_extractor = PresentationTextExtractor()
-spreadsheet_extractor = SpreadsheetTextExtractor()
-word_extractor = WordFileTextExtractor()
-html_extractor = HtmlTextExtractor()
-email_extractor = EmailTextExtractor()
-tika_extractor = TikaTextExtractor()
-extractors_list = [
-    pdf_extractor,
-    txt_extractor,
-    image_extractor,
-    presentation_extractor,
-    spreadsheet_extractor,
-    word_extractor,
-    html_extractor,
-    email_extractor,
-]
+    @cached_property
+    def html(self) -> HtmlTextExtractor:
+        return HtmlTextExtractor()
+
+    @cached_property
+    def email(self) -> EmailTextExtractor:
+        return EmailTextExtractor()
+
+    @cached_property
+    def tika(self) -> TikaTextExtractor:
+        """Fallback for files no specialized extractor handles."""
+        return TikaTextExtractor()
+
+    def for_file(self, filename: str) -> Optional[FileTextExtractor]:
+        """Return the specialized extractor for filename's extension, or None."""
+        name = self._by_extension.get(Path(filename).suffix.lower().lstrip('.'))
+        return getattr(self, name) if name else None
+
+extractors = _Extractors()
 
 def init_tesseract(cmd: Optional[str] = None):
     """Configure pytesseract to use a specific Tesseract executable if provided.
@@ -55,6 +143,49 @@ def init_tesseract(cmd: Optional[str] = None):
     if cmd:
         pytesseract.pytesseract.tesseract_cmd = cmd
 
+def _random_sample_query(db_session: Session, q, n: Optional[int], locations_loader):
+    """
+    Randomly pick up to n Files matched by q, fetching a bounded number of ids.
+
+    Sorting the whole joined File/FileLocation result by random() gets slow as
+    the catalog grows. Instead an id-only pass takes SAMPLE_OVERFETCH * n random
+    ids (ORDER BY random() LIMIT k: a bounded top-k heap over bare ids, so
+    neither the sort nor the wire grows with the match count), duplicate ids
+    from files with several matching locations are dropped, and the first n
+    Files are loaded by primary key.
+
+    Parameters
+    ----------
+    db_session : Session
+        Active SQLAlchemy session.
+    q : Query
+        Filtered File query (unordered, unlimited).
+    n : Optional[int]
+        Sample size. None means every match is processed anyway, so there is
+        nothing to sample and the matches are streamed unordered.
+    locations_loader : loader option
+        selectinload option used to load File.locations for the sample.
+
+    Returns
+    -------
+    Query
+        Query over the sampled File rows.
+    """
+    if n is None:
+        return q.options(locations_loader)
+    id_rows = q.with_entities(File.id)\
+        .order_by(func.random())\
+        .limit(SAMPLE_OVERFETCH * n)
+    # dict keeps the random order while dropping repeats
+    ids = list(dict.fromkeys(row[0] for row in id_rows))[:n]
+    return db_session.query(File).filter(File.id.in_(ids)).options(locations_loader)
+
+def _has_content(db_session: Session):
+    """Correlated EXISTS on file_contents; an index-only probe of its primary key per file."""
+    return db_session.query(FileContent.file_hash)\
+        .filter(FileContent.file_hash == File.hash)\
+        .exists()
+
 def get_files_from_tagged_locations_query(
     db_session: Session,
     tag_obj: FilingTag,
@@ -66,6 +197,7 @@ def get_files_from_tagged_locations_query(
     """generates query for fetching file locations matching a filing tag with optional filters.
 
     - Joins File ⇄ FileLocation on matching tag directory
+    - Eager-loads only the matching locations into File.locations
     - Optionally excludes already‐embedded files
     - Optionally filters by max size
     - Optionally shuffles and limits the result
@@ -73,19 +205,22 @@ def get_files_from_tagged_locations_query(
     Returns:
         List[File]: ORM objects to process
     """
-    tag_locations = FileLocation.file_server_directories.ilike(f"%/{tag_obj.full_tag_label_str}%")
+    # lower() + LIKE matches the ix_file_locations_dirs_trgm expression index
+    tag_locations = func.lower(FileLocation.file_server_directories)\
+        .like(f"%/{tag_obj.full_tag_label_str.lower()}%")
     q = db_session.query(File)\
         .join(FileLocation)\
         .filter(tag_locations)
     if exclude_embedded:
-        q = q.outerjoin(FileContent, File.hash == FileContent.file_hash)\
-             .filter(FileContent.file_hash == None)
+        q = q.filter(~_has_content(db_session))
     if max_size_mb is not None:
         max_bytes = max_size_mb * 1024 * 1024
         q = q.filter(File.size <= max_bytes)
+    # the locator walks each file's locations; load just the matching ones in one extra query
+    locations_loader = selectinload(File.locations.and_(tag_locations))
     if randomize:
-        q = q.order_by(func.random())
-    q = q.limit(n)
+        return _random_sample_query(db_session, q, n, locations_loader)
+    q = q.options(locations_loader).limit(n)
     return q
 
 def get_files_from_server_locations_query(
@@ -98,6 +233,7 @@ def get_files_from_server_locations_query(
 ):
     """generates query for fetching file locations matching a server directory with optional filters.
 
+    - Eager-loads only the locations under server_dirs into File.locations
     - Optionally excludes already‐embedded files
     - Optionally filters by max size
     - Optionally shuffles and limits the result
@@ -114,77 +250,327 @@ def get_files_from_server_locations_query(
         .join(FileLocation)\
         .filter(files_located_in_dir)
     if exclude_embedded:
-        q = q.outerjoin(FileContent, File.hash == FileContent.file_hash)\
-             .filter(FileContent.file_hash == None)
+        q = q.filter(~_has_content(db_session))
     if max_size_mb is not None:
         max_bytes = max_size_mb * 1024 * 1024
         q = q.filter(File.size <= max_bytes)
+    # the locator walks each file's locations; load just the matching ones in one extra query
+    locations_loader = selectinload(File.locations.and_(files_located_in_dir))
     if randomize:
-        q = q.order_by(func.random())
+        return _random_sample_query(db_session, q, n, locations_loader)
+    q = q.options(locations_loader)
     if n is not None:
         q = q.limit(n)
     return q
 
+def _resolve_tag(db_session: Session, some_tag: FilingTag | str, tag_cache: Optional['FilingTagCache'] = None) -> FilingTag:
+    """Return the FilingTag for a tag instance or label string."""
+    if isinstance(some_tag, str):
+        if tag_cache is not None:
+            tag_obj = tag_cache.get(some_tag)
+        else:
+            tag_obj = FilingTag.retrieve_tag_by_label(db_session, some_tag)
+        if not tag_obj:
+            raise ValueError(f"Tag '{some_tag}' not found.")
+        return tag_obj
+    if isinstance(some_tag, FilingTag):
+        return some_tag
+    raise TypeError("Tag must be a FilingTag or string label.")
+
+def _ancestor_chain(db_session: Session, tag: FilingTag, tag_cache: Optional['FilingTagCache'] = None) -> list[FilingTag]:
+    """Return the tag followed by its ancestors up to the root."""
+    chain = tag_cache.ancestors(tag.label) if tag_cache is not None else None
+    if chain is None:
+        chain = []
+        while tag is not None and tag.label not in {t.label for t in chain}:
+            chain.append(tag)
+            # by primary key rather than tag.parent, which cannot lazy-load on detached tags
+            tag = db_session.get(FilingTag, tag.parent_label) if tag.parent_label else None
+    return chain
+
+def label_files_using_tags(
+    db_session: Session,
+    file_tags: list[tuple[File, list[FilingTag | str]]],
+    label_source: str = 'rule',
+    tag_cache: Optional['FilingTagCache'] = None,
+    commit: bool = True
+):
+    """Assign filing tags (and all their ancestors) to several File records at once.
+
+    Each file's tags and their shared ancestors are merged, and the rows for
+    every file are written with a single INSERT ... ON CONFLICT DO NOTHING,
+    so labels that already exist are skipped without a lookup.
+
+    Parameters:
+        db_session (Session): Active SQLAlchemy session
+        file_tags (list[tuple[File, list[FilingTag | str]]]): Each target File
+            ORM instance with the tag instances or label strings to apply
+        label_source (str): Origin of the label ('human','rule','model')
+        tag_cache (Optional[FilingTagCache]): Preloaded tag tree used to resolve
+            the tags and their ancestors without further queries
+        commit (bool): Commit after inserting; pass False to batch the labels
+            into a larger transaction
+
+    Returns:
+        list[tuple[int, str]]: (file_id, tag label) pairs newly inserted
+    """
+    label_rows = []
+    for file_obj, tags in file_tags:
+        labels = {}
+        for some_tag in tags:
+            for t in _ancestor_chain(db_session, _resolve_tag(db_session, some_tag, tag_cache), tag_cache):
+                labels.setdefault(t.label, t)
+        label_rows.extend(
+            dict(
+                file_id=file_obj.id,
+                file_hash=file_obj.hash,
+                tag=t.label,
+                is_primary=(t.parent_label is None),
+                label_source=label_source
+            )
+            for t in labels.values()
+        )
+    if not label_rows:
+        return []
+    stmt = pg_insert(FileTagLabel).values(label_rows)\
+        .on_conflict_do_nothing(index_elements=['file_id', 'tag'])\
+        .returning(FileTagLabel.file_id, FileTagLabel.tag)
+    inserted = [(row.file_id, row.tag) for row in db_session.execute(stmt)]
+    if commit:
+        db_session.commit()
+    return inserted
+
+def label_file_using_tags(
+    db_session: Session,
+    file_obj: File,
+    tags: list[FilingTag | str],
+    label_source: str = 'rule',
+    tag_cache: Optional['FilingTagCache'] = None,
+    commit: bool = True
+):
+    """Assign several filing tags (and all their ancestors) to a File record.
+
+    See label_files_using_tags; this is the single-file form.
+
+    Parameters:
+        db_session (Session): Active SQLAlchemy session
+        file_obj (File): Target File ORM instance
+        tags (list[FilingTag | str]): Tag instances or label strings
+        label_source (str): Origin of the label ('human','rule','model')
+        tag_cache (Optional[FilingTagCache]): Preloaded tag tree used to resolve
+            the tags and their ancestors without further queries
+        commit (bool): Commit after inserting; pass False to batch several
+            files into one transaction
+
+    Returns:
+        list[str]: Tag labels newly inserted for the file
+    """
+    inserted = label_files_using_tags(db_session, [(file_obj, tags)], label_source,
+                                      tag_cache=tag_cache, commit=commit)
+    return [tag for _file_id, tag in inserted]
+
 def label_file_using_tag(
     db_session: Session,
     file_obj: File,
     some_tag: FilingTag | str,
-    label_source: str = 'rule'
+    label_source: str = 'rule',
+    tag_cache: Optional['FilingTagCache'] = None,
+    commit: bool = True
 ):
     """Assign a filing tag (and its ancestors) to a File record.
 
-    Inserts only missing labels and commits at the end.
+    See label_file_using_tags; this is the single-tag form.
 
     Parameters:
         db_session (Session): Active SQLAlchemy session
         file_obj (File): Target File ORM instance
         some_tag (FilingTag | str): Tag instance or label string
         label_source (str): Origin of the label ('human','rule','model')
+        tag_cache (Optional[FilingTagCache]): Preloaded tag tree used to resolve
+            the tag and its ancestors without further queries
+        commit (bool): Commit after inserting; pass False to batch several
+            files into one transaction
+
+    Returns:
+        list[str]: Tag labels newly inserted for the file
     """
-    if isinstance(some_tag, str):
-        tag_obj = FilingTag.retrieve_tag_by_label(db_session, some_tag)
-        if not tag_obj:
-            raise ValueError(f"Tag '{some_tag}' not found.")
-        current_tag = tag_obj
-    elif isinstance(some_tag, FilingTag):
-        current_tag = some_tag
-    else:
-        raise TypeError("Tag must be a FilingTag or string label.")
-    last_record = None
-    while current_tag:
-        exists = db_session.query(FileTagLabel).filter_by(
-            file_id=file_obj.id,
-            tag=current_tag.label
-        ).first()
-        if exists:
-            current_tag = current_tag.parent
-            continue
-        record = FileTagLabel(
-            file_id=file_obj.id,
-            file_hash=file_obj.hash,
-            tag=current_tag.label,
-            is_primary=(current_tag.parent is None),
-            label_source=label_source
-        )
-        db_session.add(record)
-        last_record = record
-        current_tag = current_tag.parent
-    db_session.commit()
-    return last_record
+    return label_file_using_tags(db_session, file_obj, [some_tag], label_source,
+                                 tag_cache=tag_cache, commit=commit)
+
+def build_tag_matcher(session: Session, tags: Optional[list[FilingTag]] = None):
+    """
+    Load all FilingTags once (unless tags are given) and build a matcher for
+    file_tags_from_path.
 
-def file_tags_from_path(pth: str|Path, session: Session) -> list[FilingTag]:
+    Uses a pyahocorasick automaton when available, so a path is matched
+    against every tag in a single pass; otherwise falls back to a list of
+    (lowercased full_tag_label_str, tag) pairs scanned one by one.
+    """
+    if tags is None:
+        tags = session.query(FilingTag).all()
+    if not _HAS_AHOCORASICK or not tags:
+        return [(tag.full_tag_label_str.lower(), tag) for tag in tags]
+    automaton = ahocorasick.Automaton()
+    for tag in tags:
+        key = tag.full_tag_label_str.lower()
+        automaton.add_word(key, automaton.get(key, ()) + (tag,))
+    automaton.make_automaton()
+    return automaton
+
+# Matcher used when file_tags_from_path is called without one; built on first use
+_default_matcher = None
+
+def file_tags_from_path(pth: str|Path, session: Session, matcher=None) -> list[FilingTag]:
     """
     Given a filesystem path, return all FilingTag rows whose
     full_tag_label_str appears anywhere in that path.
+
+    Without a matcher, one is built from the session's tags on the first call
+    and reused for the rest of the process, so tags added afterwards are not
+    seen; pass a matcher from build_tag_matcher to control its lifetime. The
+    default matcher's tags are detached from that first session, so they stay
+    readable (column attributes only) after it commits or closes.
     """
+    global _default_matcher
     path_str = str(pth).lower()
-    all_tags = session.query(FilingTag).all()
-    return [tag for tag in all_tags if tag.full_tag_label_str.lower() in path_str]
+    if matcher is None:
+        if _default_matcher is None:
+            tags = session.query(FilingTag).all()
+            for t in tags:
+                session.expunge(t)
+            _default_matcher = build_tag_matcher(session, tags)
+        matcher = _default_matcher
+    if isinstance(matcher, list):
+        return [tag for label, tag in matcher if label in path_str]
+    # dict keeps first-match order while dropping repeat hits
+    hits = {}
+    for _, tags in matcher.iter(path_str):
+        for tag in tags:
+            hits[tag.label] = tag
+    return list(hits.values())
+
+class FilingTagCache:
+    """
+    Pipeline-scoped snapshot of the FilingTag tree.
+
+    Loads every tag in one query and precomputes each tag's ancestor chain,
+    so path matching and labeling need no further tag queries. Build one per
+    pipeline run; it does not see tags added afterwards.
+
+    The tags are detached from the session they were loaded with: the pipeline
+    commits that session once per batch, and attached instances would be
+    expired by each commit and re-SELECTed one by one on their next attribute
+    read. Only column attributes (label, parent_label, description) are
+    available on them; use ancestors() rather than FilingTag.parent.
+
+    Attributes
+    ----------
+    by_label : dict[str, FilingTag]
+        Tags keyed by label.
+    chains : dict[str, list[FilingTag]]
+        For each label, the tag followed by its ancestors up to the root.
+    matcher
+        Path matcher from build_tag_matcher.
+    """
+    def __init__(self, session: Session):
+        tags = session.query(FilingTag).all()
+        for t in tags:
+            session.expunge(t)
+        self.by_label = {t.label: t for t in tags}
+        self.chains = {t.label: self._chain(t) for t in tags}
+        self.matcher = build_tag_matcher(session, tags)
+
+    def _chain(self, tag: FilingTag) -> list[FilingTag]:
+        chain = []
+        while tag is not None and tag not in chain:
+            chain.append(tag)
+            tag = self.by_label.get(tag.parent_label)
+        return chain
+
+    def get(self, label_str: str) -> Optional[FilingTag]:
+        """Cached counterpart of FilingTag.retrieve_tag_by_label."""
+        return self.by_label.get(label_str.split(' ')[0])
+
+    def match_path(self, pth: str | Path) -> list[FilingTag]:
+        """Return the tags whose full_tag_label_str appears in the path."""
+        return file_tags_from_path(pth, None, self.matcher)
+
+    def ancestors(self, label: str) -> Optional[list[FilingTag]]:
+        """Return the tag and its ancestors, or None if the label is unknown."""
+        return self.chains.get(label)
 
 # --- helper functions to DRY up file processing loops ---
+
+# Thread pool overlapping location stats; only up while _run_file_pipeline runs
+_stat_pool: Optional[ThreadPoolExecutor] = None
+# path -> exists results gathered by _prefetch_exists for the current pipeline run
+_exists_cache: dict = {}
+
+@contextmanager
+def _location_stat_pool():
+    """Start the location stat pool for the duration of a pipeline run, shutting it down after."""
+    global _stat_pool
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS, thread_name_prefix='locate-stat') as pool:
+        _stat_pool = pool
+        try:
+            yield pool
+        finally:
+            _stat_pool = None
+
+def _stat_paths(paths: list) -> dict:
+    """Map each path to whether it exists, stat'ing concurrently when the run's pool is up."""
+    if _stat_pool is None or len(paths) < 2:
+        return {path: os.path.exists(path) for path in paths}
+    return dict(zip(paths, _stat_pool.map(os.path.exists, paths)))
+
+def _prefetch_exists(files, server_mount):
+    """
+    Stat every loaded location path of every file concurrently and remember
+    the results, so the locators do not wait on one file's stats at a time.
+
+    Parameters
+    ----------
+    files : list[File]
+        Files whose (already loaded) locations should be checked.
+    server_mount : str
+        Base mount path on the local machine.
+    """
+    paths = list({
+        path for f in files for loc in f.locations
+        if (path := loc.local_filepath(server_mount))
+    })
+    _exists_cache.update(_stat_paths(paths))
+
+def _first_existing(candidates):
+    """
+    Return the first (location, path) pair whose path exists, using results
+    from _prefetch_exists where available and checking the rest concurrently.
+
+    Parameters
+    ----------
+    candidates : list[tuple[FileLocation, Path | None]]
+        Locations with their local paths, in preference order.
+
+    Returns
+    -------
+    tuple
+        (location, path), or (None, None) if no path exists.
+    """
+    candidates = [(loc, path) for loc, path in candidates if path]
+    unknown = [path for _, path in candidates if path not in _exists_cache]
+    exists = _stat_paths(unknown)
+    for loc, path in candidates:
+        if _exists_cache.get(path, exists.get(path)):
+            return loc, path
+    return None, None
+
 def _locate_for_tag(file_obj, server_mount, tag):
     """
-    Locate the first FileLocation for a given File that matches a FilingTag.
+    Locate the first existing FileLocation of a File loaded by
+    get_files_from_tagged_locations_query.
+
+    That query only loads the locations matching the tag into File.locations,
+    so no per-location filtering is needed here.
 
     Parameters
     ----------
@@ -192,8 +578,8 @@ def _locate_for_tag(file_obj, server_mount, tag):
         ORM File instance containing .locations.
     server_mount : str
         Base mount path on the local machine.
-    tag : FilingTag
-        The FilingTag whose full_tag_label_str is used to filter locations.
+    tag : FilingTag | str
+        The FilingTag (or its label) the file was queried for; returned as the extra value.
 
     Returns
     -------
@@ -203,18 +589,15 @@ def _locate_for_tag(file_obj, server_mount, tag):
             Full filesystem path to the file on the local machine, or None.
           filename : str
             The filename component, or None.
-          tag : FilingTag
+          tag : FilingTag | str
             The original tag passed in, or None if not found.
     """
-    for loc in file_obj.locations:
-        if tag.full_tag_label_str.lower() not in loc.file_server_directories.lower():
-            continue
-        path = loc.local_filepath(server_mount)
-        if path and os.path.exists(path):
-            return path, loc.filename, tag
+    loc, path = _first_existing([(loc, loc.local_filepath(server_mount)) for loc in file_obj.locations])
+    if loc is not None:
+        return path, loc.filename, tag
     return None, None, None
 
-def _locate_for_location(session, file_obj, server_mount, target_dirs):
+def _locate_for_location(session, file_obj, server_mount, target_dirs, tag_cache=None):
     """
     Locate the first FileLocation for a File under specified server directories 
     and retrieve any FilingTags inferred from the path.
@@ -229,6 +612,8 @@ def _locate_for_location(session, file_obj, server_mount, target_dirs):
         Base mount path on the local machine.
     target_dirs : str
         POSIX-style path fragment to match FileLocation.file_server_directories.
+    tag_cache : FilingTagCache, optional
+        Preloaded tag tree used for path matching; tags are queried per call if omitted.
 
     Returns
     -------
@@ -241,45 +626,354 @@ def _locate_for_location(session, file_obj, server_mount, target_dirs):
           tags : list[FilingTag]
             List of tags whose full_tag_label_str appears in the path; empty if none.
     """
-    for loc in file_obj.locations:
-        if not loc.file_server_directories.startswith(target_dirs):
-            continue
-        path = loc.local_filepath(server_mount)
-        if path and os.path.exists(path):
-            path_tags = file_tags_from_path(path, session)
-            return path, loc.filename, path_tags
-    return None, None, None
+    loc, path = _first_existing([
+        (loc, loc.local_filepath(server_mount)) for loc in file_obj.locations
+        if loc.file_server_directories.startswith(target_dirs)
+    ])
+    if loc is None:
+        return None, None, None
+    if tag_cache is not None:
+        path_tags = tag_cache.match_path(path)
+    else:
+        path_tags = file_tags_from_path(path, session)
+    return path, loc.filename, path_tags
+
+# Scratch directory shared by the extraction workers; set by _init_extraction_worker
+_scratch_dir: Optional[str] = None
+
+def _init_extraction_worker(
+    tesseract_cmd: Optional[str] = None,
+    scratch_dir: Optional[str] = None,
+    ocr_slots=None,
+    ocr_limit: int = DEFAULT_OCR_CONCURRENCY,
+):
+    """
+    ProcessPoolExecutor initializer: configure OCR once per worker process and
+    record the scratch directory used for staged copies.
+
+    ocr_slots is a multiprocessing semaphore created by the parent; sharing it
+    caps concurrent OCR runs across all workers of both pools rather than per process.
+    """
+    global _scratch_dir
+    init_tesseract(tesseract_cmd)
+    if ocr_slots is not None:
+        PDFTextExtractor.use_shared_ocr_slots(ocr_slots, ocr_limit)
+    _scratch_dir = scratch_dir
+
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, XFS)
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy src to dst as cheaply as the platform allows.
+
+    Tries, in order: a reflink clone (O(1) on btrfs/XFS), a kernel-side
+    os.copy_file_range into a preallocated file, and finally shutil.copyfile
+    (which uses its own platform fast paths where it can).
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                try:
+                    import fcntl
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    return
+                except (ImportError, OSError):
+                    pass
+                remaining = os.fstat(fsrc.fileno()).st_size
+                if remaining and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fdst.fileno(), 0, remaining)
+                    except OSError:
+                        pass
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError:
+            # e.g. copy_file_range across filesystems on older kernels
+            pass
+    shutil.copyfile(src, dst)
 
-def _label_for_tag(session, file_obj, tag):
+def _stage_for_extractor(local_path: str, filename: str, extractor) -> Optional[str]:
     """
-    Apply a single FilingTag (and its ancestors) to a File record.
+    Stage a file in the scratch directory when it cannot be extracted in place.
+
+    Most extractors read straight from the server mount. A staged path is only
+    needed when the extractor requires a local copy, or when the on-disk name
+    has a different extension than the recorded filename (extractors dispatch
+    on the suffix); the latter case is served by a symlink where possible.
 
     Parameters
     ----------
-    session : Session
-        Active SQLAlchemy session.
-    file_obj : File
-        ORM File instance to label.
-    tag : FilingTag
-        The FilingTag to apply.
+    local_path : str
+        Full path of the file on the local machine.
+    filename : str
+        Recorded filename, which drives extractor selection.
+    extractor : FileTextExtractor | None
+        Extractor chosen for the file (None means the Tika fallback).
+
+    Returns
+    -------
+    Optional[str]
+        Path of the staged file, or None if local_path can be used directly.
+    """
+    needs_copy = extractor is not None and extractor.requires_local_copy
+    if not needs_copy and Path(local_path).suffix.lower() == Path(filename).suffix.lower():
+        return None
+
+    # each worker handles one file at a time, so the pid keeps staged names unique
+    staged = os.path.join(_scratch_dir or tempfile.gettempdir(), f"{os.getpid()}-{filename}")
+    if os.path.lexists(staged):
+        os.remove(staged)
+    if needs_copy:
+        _fast_copy(local_path, staged)
+    else:
+        try:
+            os.symlink(local_path, staged)
+        except OSError:
+            # symlinks may need extra privileges on Windows
+            _fast_copy(local_path, staged)
+    return staged
+
+def _extract_mapped(local_path: str, filename: str, from_bytes) -> str:
+    """
+    Feed a file to an extractor's from_bytes method through a read-only mmap,
+    so the contents come straight from the page cache without an extra copy.
     """
-    label_file_using_tag(session, file_obj, tag)
+    with open(local_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return from_bytes(b'', filename)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return from_bytes(mm, filename)
 
-def _label_for_location(session, file_obj, tags):
+def _extract_file_text(local_path: str, filename: str, text_length_threshold: int):
     """
-    Apply default and inferred FilingTags to a File based on its server path.
+    Extract and clean the text of a located file.
+
+    Runs inside a worker process, so it only takes and returns picklable values.
+    Extractors that accept raw bytes (from_bytes) get a memory map of the file;
+    the rest read it in place unless they need a staged copy
+    (see _stage_for_extractor).
 
     Parameters
     ----------
+    local_path : str
+        Full path of the file on the local machine.
+    filename : str
+        Recorded filename (drives extractor selection).
+    text_length_threshold : int
+        Minimum length of extracted text required to proceed with embedding.
+
+    Returns
+    -------
+    tuple
+        (text, error, tb) where:
+          text : str | None
+            Cleaned text, or None if extraction failed or the text was too short.
+          error : str | None
+            Error message if extraction raised, else None.
+          tb : str | None
+            Formatted traceback accompanying error, else None.
+    """
+    staged = None
+    try:
+        extractor = extractors.for_file(filename)
+        from_bytes = getattr(extractor, 'from_bytes', None)
+        if from_bytes is not None:
+            text = _extract_mapped(local_path, filename, from_bytes)
+        else:
+            staged = _stage_for_extractor(local_path, filename, extractor)
+            extract_path = staged or local_path
+            text = extractor(extract_path) if extractor else extractors.tika(extract_path)
+        if not text or len(text) < text_length_threshold:
+            return None, None, None
+        text = clean_text(text)
+        # cleaning can collapse whitespace-heavy text below the threshold
+        if len(text) < text_length_threshold:
+            return None, None, None
+        return text, None, None
+    except Exception as exc:
+        return None, str(exc), traceback.format_exc()
+    finally:
+        if staged:
+            try:
+                os.remove(staged)
+            except OSError:
+                pass
+
+def _open_embedding_cache():
+    """
+    Open the on-disk embedding cache at EMBED_CACHE_DIR.
+
+    Returns
+    -------
+    diskcache.Cache | None
+        The cache, or None if diskcache is not installed or the directory
+        cannot be opened.
+    """
+    if not _HAS_DISKCACHE:
+        return None
+    try:
+        return diskcache.Cache(EMBED_CACHE_DIR)
+    except Exception as exc:
+        logging.getLogger('add_files_pipeline').warning(
+            f"Embedding cache unavailable at {EMBED_CACHE_DIR}: {exc}")
+        return None
+
+@dataclass
+class _PendingEmbedding:
+    """Cleaned text waiting to be embedded, with what is needed to store and label it."""
+    file_obj: File
+    local_path: Path
+    text: str
+    extra: object
+    vec: object = None  # set when the embedding came from the cache
+
+def _text_digest(text: str) -> bytes:
+    """Key identifying a cleaned text, stored as FileContent.source_text_hash."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+# Whether each database (by URL) has file_contents.source_text_hash; looked up once per process
+_text_hash_column: dict = {}
+
+def _has_text_hash_column(session: Session) -> bool:
+    """
+    Whether file_contents has the source_text_hash column.
+
+    Databases created before the column existed lack it until the ALTER TABLE in
+    db/models.py is run; until then batches skip the identical-text lookup and
+    store rows without a digest, rather than failing on the missing column.
+    """
+    bind = session.get_bind()
+    key = str(bind.engine.url)
+    if key not in _text_hash_column:
+        columns = {c['name'] for c in inspect(bind).get_columns(FileContent.__tablename__)}
+        _text_hash_column[key] = 'source_text_hash' in columns
+        if not _text_hash_column[key]:
+            logging.getLogger('add_files_pipeline').warning(
+                "file_contents.source_text_hash is missing (see db/models.py for the migration); "
+                "identical texts will not share stored embeddings")
+    return _text_hash_column[key]
+
+def _stored_vectors(session: Session, model_name: str, digests: set[bytes]) -> dict:
+    """Map each digest that already has a stored embedding from model_name to that vector."""
+    if not digests:
+        return {}
+    rows = session.query(FileContent.source_text_hash, FileContent.minilm_emb)\
+        .filter(FileContent.source_text_hash.in_(digests),
+                FileContent.minilm_model == model_name,
+                FileContent.minilm_emb.isnot(None))
+    return {digest: emb for digest, emb in rows}
+
+def _flush_batch(pending: list[_PendingEmbedding], session: Session, embedding_client, emb_cache=None) -> list[_PendingEmbedding]:
+    """
+    Encode a batch of pending texts in one call and store their FileContent rows
+    with one Core INSERT. The transaction is left open so the caller can commit
+    the batch's labels together with its content.
+
+    Texts are encoded shortest-first so each forward pass pads as little as
+    possible; vectors are mapped back to their files before storing. Items
+    that already carry a cached vector are stored without encoding, and so
+    are texts identical to one already stored (matched on source_text_hash,
+    when the database has that column; see _has_text_hash_column);
+    repeated texts within the batch are encoded once. If the
+    batch encode raises, the texts are retried one at a time so only the
+    failing items are dropped.
+
+    Parameters
+    ----------
+    pending : list[_PendingEmbedding]
+        Items to embed.
     session : Session
         Active SQLAlchemy session.
-    file_obj : File
-        ORM File instance to label.
-    tags : list[FilingTag]
-        Inferred tags from the file path; each will be applied after the default tag.
+    embedding_client : MiniLMEmbedder
+        Client for generating vector embeddings.
+    emb_cache : diskcache.Cache, optional
+        Cache that newly computed embeddings are written to, as
+        (text, int8 codes, scale) from quantize_int8.
+
+    Returns
+    -------
+    list[_PendingEmbedding]
+        The items whose FileContent rows were written.
     """
-    for t in tags:
-        label_file_using_tag(session, file_obj, t)
+    logger = logging.getLogger('add_files_pipeline')
+    vecs = [item.vec for item in pending]
+    digests = [_text_digest(item.text) for item in pending]
+    # identical text already stored (by this run's earlier batches or a previous
+    # run) reuses its vector; duplicates within the batch are encoded once
+    has_digest_column = _has_text_hash_column(session)
+    reused = _stored_vectors(session, embedding_client.model_name,
+                             {digests[i] for i, v in enumerate(vecs) if v is None}) if has_digest_column else {}
+    first_with_text = {}
+    for i, v in enumerate(vecs):
+        if v is None:
+            if digests[i] in reused:
+                vecs[i] = reused[digests[i]]
+            else:
+                first_with_text.setdefault(digests[i], i)
+    order = sorted(first_with_text.values(),
+                   key=lambda i: min(len(pending[i].text), MAX_EMBED_CHARS))
+    # only the leading MAX_EMBED_CHARS reach the model; the full text is still stored
+    texts = [pending[i].text[:MAX_EMBED_CHARS] for i in order]
+    try:
+        sorted_vecs = embedding_client.encode(texts) if texts else []
+    except Exception as exc:
+        # don't let one bad text sink the whole batch: retry item by item
+        logger.warning(f"Batch encode of {len(texts)} texts failed ({exc}); retrying individually")
+        sorted_vecs = []
+        for pos, t in enumerate(texts):
+            try:
+                emb = embedding_client.encode([t])
+                sorted_vecs.append(emb[0] if emb else None)
+            except Exception as item_exc:
+                logger.error(f"Error encoding {pending[order[pos]].file_obj.hash}: {item_exc}")
+                sorted_vecs.append(None)
+    for pos, i in enumerate(order[:len(sorted_vecs)]):
+        vecs[i] = sorted_vecs[pos]
+    for i, item in enumerate(pending):
+        if item.vec is not None:
+            continue
+        if vecs[i] is None:
+            vecs[i] = vecs[first_with_text.get(digests[i], i)]
+        if emb_cache is not None and vecs[i] is not None:
+            try:
+                codes, scale = quantize_int8(vecs[i])
+                emb_cache.set((embedding_client.model_name, item.file_obj.hash),
+                              (item.text, codes, float(scale)))
+            except Exception as exc:
+                logger.warning(f"Could not cache embedding for {item.file_obj.hash}: {exc}")
+
+    stored, rows = [], []
+    for item, vec, digest in zip(pending, vecs, digests):
+        if vec is None:
+            logger.warning(f"Embedding failed for {item.file_obj.hash}")
+            continue
+        row = dict(
+            file_hash=item.file_obj.hash,
+            source_text=item.text,
+            text_length=len(item.text),
+            minilm_model=embedding_client.model_name,
+            # the column is halfvec; send fp16 rather than letting the server narrow fp32
+            minilm_emb=np.asarray(vec, dtype=np.float16)
+        )
+        if has_digest_column:
+            row['source_text_hash'] = digest
+        rows.append(row)
+        stored.append(item)
+    if rows:
+        # one executemany round-trip; rows for hashes that already have content are skipped
+        session.execute(
+            pg_insert(FileContent).on_conflict_do_nothing(index_elements=['file_hash']),
+            rows
+        )
+    for item in stored:
+        logger.info(f"Embedded file {item.file_obj.hash} with {embedding_client.model_name}")
+    return stored
 
 def _run_file_pipeline(
     files,
@@ -289,16 +983,21 @@ def _run_file_pipeline(
     tesseract_cmd,
     text_length_threshold,
     locator_fn,
-    labeling_fn,
-    apply_exclusions: bool = True
+    tags_fn,
+    tag_cache: Optional[FilingTagCache] = None,
+    apply_exclusions: bool = True,
+    max_workers: Optional[int] = None,
+    embed_batch_size: int = EMBED_BATCH_SIZE,
+    chunk_size: int = FILE_CHUNK_SIZE,
+    fast_path_max_mb: Optional[float] = FAST_PATH_MAX_MB
 ):
     """
     Core loop to process, extract, embed, and label a list of File ORM objects.
 
     Parameters
     ----------
-    files : list[File]
-        List of ORM File instances to process.
+    files : Iterable[File]
+        ORM File instances to process; may be a streamed (yield_per) query.
     server_mount : str
         Base mount path for locating files.
     session : Session
@@ -306,20 +1005,43 @@ def _run_file_pipeline(
     embedding_client : MiniLMEmbedder
         Client for generating vector embeddings.
     tesseract_cmd : Optional[str]
-        Path to tesseract executable for OCR; passed to init_tesseract.
+        Path to tesseract executable for OCR; passed to init_tesseract in each worker.
     text_length_threshold : int
         Minimum length of extracted text required to proceed with embedding.
     locator_fn : callable
         Function to locate the file on disk and return (path, filename, extra).
-    labeling_fn : callable
-        Function to apply labels to a File after successful embedding.
+    tags_fn : callable
+        Function (file_obj, extra) -> list of FilingTags to label a File with
+        after successful embedding; extra is the locator's third value.
+    tag_cache : FilingTagCache, optional
+        Preloaded tag tree used to resolve the tags' ancestors when labeling.
+    max_workers : Optional[int]
+        Number of extraction worker processes; defaults to os.cpu_count().
+    embed_batch_size : int
+        Number of cleaned texts encoded per embedding call.
+    chunk_size : int
+        Number of files located and extracted per round.
+    fast_path_max_mb : Optional[float]
+        Files larger than this are extracted in a separate pool of
+        SLOW_POOL_WORKERS processes; None sends everything to the main pool.
 
     Notes
     -----
-    - Copies files to a temporary directory before extraction.
-    - Uses a specialized extractor or Tika fallback for text extraction.
-    - Normalizes and cleans text before embedding.
-    - Commits each embedding and labeling operation immediately.
+    - Locating files and path exclusions are resolved in this process, since they
+      need the DB session.
+    - Extraction (specialized extractor or Tika fallback) and text cleaning
+      run in a pool of spawned worker processes.
+    - Embedding and DB writes stay in this process, so the model is loaded once
+      and the session never crosses process boundaries.
+    - Texts are embedded in batches of embed_batch_size; each batch's content
+      rows and labels are written in a single transaction.
+    - Files are consumed chunk_size at a time, so a streamed query keeps only
+      one chunk of ORM objects (and their locations) in memory.
+    - Files whose hash already has a FileContent row (checked with one query
+      per chunk) are only labeled.
+    - If diskcache is installed, texts and int8-quantized vectors are cached on
+      disk under EMBED_CACHE_DIR keyed by (model_name, file hash), so content
+      seen on an earlier run is stored and labeled without extraction or encoding.
     """
     # Lazy import to avoid circular imports
     try:
@@ -328,62 +1050,162 @@ def _run_file_pipeline(
         PathPattern = None  # Fallback if model not available
 
     logger = logging.getLogger('add_files_pipeline')
-    init_tesseract(tesseract_cmd)
-    for idx, file_obj in enumerate(files, start=1):
-        logger.info(f"Processing {idx}/{len(files)}: File hash {file_obj.hash}")
-        if not file_obj.locations:
-            logger.warning(f"No locations for file hash {file_obj.hash}. Skipping.")
-            continue
-        local_path, filename, extra = locator_fn(session, file_obj, server_mount)
-        if not local_path or not filename:
-            logger.warning(f"File hash {file_obj.hash} not found on server using the locator function.")
-            continue
-        # Exclude from embedding based on dedicated context
-        if apply_exclusions and PathPattern is not None:
-            try:
-                if PathPattern.is_excluded(session, str(local_path), context='add_files_embedding'):
-                    logger.info(f"Skipping embedding for excluded file: {local_path}")
-                    continue
-            except Exception as _exc:
-                logger.warning(f"PathPattern exclusion check failed for {local_path}: {_exc}")
+    emb_cache = _open_embedding_cache()
+    pending: list[_PendingEmbedding] = []
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+    def apply_labels(items):
+        file_tags = []
+        for item in items:
             try:
-                temp_fp = os.path.join(temp_dir, filename)
-                shutil.copyfile(local_path, temp_fp)
-                extractor = get_extractor_for_file(temp_fp, extractors_list)
-                text = extractor(temp_fp) if extractor else tika_extractor(temp_fp)
-                if text and len(text) >= text_length_threshold:
-                    text = common_char_replacements(text)
-                    text = strip_diacritics(text)
-                    text = normalize_unicode(text)
-                    text = normalize_whitespace(text)
-                    emb = embedding_client.encode([text])
-                    vec = emb[0] if emb else None
-                    if vec is not None:
-                        fc = FileContent(
-                            file_hash=file_obj.hash,
-                            source_text=text,
-                            text_length=len(text),
-                            minilm_model=embedding_client.model_name,
-                            minilm_emb=vec
-                        )
-                        session.add(fc)
-                        session.commit()
-                        logger.info(f"Embedded file {file_obj.hash} with {embedding_client.model_name}")
-                        # Apply tagging only if not excluded for tagging context
-                        if not (apply_exclusions and PathPattern is not None and
-                                PathPattern.is_excluded(session, str(local_path), context='add_files_tagging')):
-                            labeling_fn(session, file_obj, extra)
-                        else:
-                            logger.info(f"Skipping tagging for excluded file: {local_path}")
-                    else:
-                        logger.warning(f"Embedding failed for {file_obj.hash}")
+                # Apply tagging only if not excluded for tagging context
+                if not (apply_exclusions and PathPattern is not None and
+                        PathPattern.is_excluded(session, str(item.local_path), context='add_files_tagging')):
+                    file_tags.append((item.file_obj, tags_fn(item.file_obj, item.extra)))
                 else:
-                    logger.warning(f"Text too short or empty for {file_obj.hash}")
+                    logger.info(f"Skipping tagging for excluded file: {item.local_path}")
             except Exception as exc:
-                logger.error(f"Error {file_obj.hash}: {exc}")
+                logger.error(f"Error {item.file_obj.hash}: {exc}")
                 logger.debug(traceback.format_exc())
+        try:
+            # one upsert for every label in the batch
+            with session.begin_nested():
+                label_files_using_tags(session, file_tags, tag_cache=tag_cache, commit=False)
+        except Exception as exc:
+            logger.warning(f"Batch labeling of {len(file_tags)} files failed ({exc}); retrying individually")
+            for file_obj, tags in file_tags:
+                try:
+                    # savepoint so one bad file does not undo the rest of the batch's labels
+                    with session.begin_nested():
+                        label_file_using_tags(session, file_obj, tags, tag_cache=tag_cache, commit=False)
+                except Exception as item_exc:
+                    logger.error(f"Error {file_obj.hash}: {item_exc}")
+                    logger.debug(traceback.format_exc())
+        # the batch's labels (and content rows, when called from flush_pending)
+        # go out in one transaction
+        session.commit()
+
+    def flush_pending():
+        try:
+            stored = _flush_batch(pending, session, embedding_client, emb_cache)
+        except Exception as exc:
+            session.rollback()
+            logger.error(f"Error embedding batch of {len(pending)} files: {exc}")
+            logger.debug(traceback.format_exc())
+            stored = []
+        apply_labels(stored)
+        pending.clear()
+
+    def locate_chunk(chunk, offset):
+        """Resolve a chunk of files to extraction jobs, queueing label-only and cached ones."""
+        # files whose content is already stored only need labels
+        embedded_hashes = {
+            row.file_hash for row in session.query(FileContent.file_hash)
+            .filter(FileContent.file_hash.in_([f.hash for f in chunk]))
+        }
+        label_only = []
+        _prefetch_exists(chunk, server_mount)
+        jobs = []
+        for idx, file_obj in enumerate(chunk, start=offset + 1):
+            logger.info(f"Locating {idx}: File hash {file_obj.hash}")
+            if not file_obj.locations:
+                logger.warning(f"No locations for file hash {file_obj.hash}. Skipping.")
+                continue
+            local_path, filename, extra = locator_fn(session, file_obj, server_mount)
+            if not local_path or not filename:
+                logger.warning(f"File hash {file_obj.hash} not found on server using the locator function.")
+                continue
+            # Exclude from embedding based on dedicated context
+            if apply_exclusions and PathPattern is not None:
+                try:
+                    if PathPattern.is_excluded(session, str(local_path), context='add_files_embedding'):
+                        logger.info(f"Skipping embedding for excluded file: {local_path}")
+                        continue
+                except Exception as _exc:
+                    logger.warning(f"PathPattern exclusion check failed for {local_path}: {_exc}")
+            if file_obj.hash in embedded_hashes:
+                logger.info(f"Content already stored for {file_obj.hash}; labeling only")
+                label_only.append(_PendingEmbedding(file_obj, local_path, None, extra))
+                continue
+            # content embedded on an earlier run skips extraction and encoding
+            hit = emb_cache.get((embedding_client.model_name, file_obj.hash)) if emb_cache is not None else None
+            if hit is not None:
+                logger.info(f"Using cached embedding for {file_obj.hash}")
+                text, codes, scale = hit
+                pending.append(_PendingEmbedding(file_obj, local_path, text, extra, dequantize_int8(codes, scale)))
+                if len(pending) >= embed_batch_size:
+                    flush_pending()
+                continue
+            jobs.append((file_obj, local_path, filename, extra))
+        apply_labels(label_only)
+        _exists_cache.clear()
+        return jobs
+
+    def handle_result(future, job):
+        file_obj, local_path, _filename, extra = job
+        logger.info(f"Processing File hash {file_obj.hash}")
+        try:
+            text, error, tb = future.result()
+        except Exception as exc:
+            # e.g. a worker process died mid-file
+            text, error, tb = None, str(exc), traceback.format_exc()
+        if error:
+            logger.error(f"Error {file_obj.hash}: {error}")
+            logger.debug(tb)
+            return
+        if not text:
+            logger.warning(f"Text too short or empty for {file_obj.hash}")
+            return
+        pending.append(_PendingEmbedding(file_obj, local_path, text, extra))
+        if len(pending) >= embed_batch_size:
+            flush_pending()
+
+    # parallelism comes from the worker processes; keep Tesseract's OpenMP
+    # threads from oversubscribing the CPUs (inherited by spawned workers)
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    spawn_ctx = mp.get_context('spawn')
+    # one OCR limit for every worker in both pools (a per-process semaphore would multiply it)
+    ocr_slots = spawn_ctx.BoundedSemaphore(DEFAULT_OCR_CONCURRENCY)
+    pool_kwargs = dict(
+        mp_context=spawn_ctx,
+        initializer=_init_extraction_worker,
+    )
+    slow_path_bytes = fast_path_max_mb * 1024 * 1024 if fast_path_max_mb is not None else None
+    # workers are only spawned once something is submitted, so chunks with
+    # no extraction jobs (e.g. all cache hits) cost nothing here
+    with tempfile.TemporaryDirectory() as scratch_dir, _location_stat_pool(), \
+            ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                initargs=(tesseract_cmd, scratch_dir, ocr_slots, DEFAULT_OCR_CONCURRENCY), **pool_kwargs) as executor, \
+            ProcessPoolExecutor(max_workers=SLOW_POOL_WORKERS,
+                                initargs=(tesseract_cmd, scratch_dir, ocr_slots, DEFAULT_OCR_CONCURRENCY), **pool_kwargs) as slow_executor:
+        # large files (long OCR/Tika runs) go to a small pool of their own and are
+        # collected whenever they finish, so they never hold up a chunk
+        slow_futures = {}
+        # files may be a streamed query; only one chunk of them is held at a time
+        offset = 0
+        for chunk in batched(files, chunk_size):
+            jobs = locate_chunk(chunk, offset)
+            offset += len(chunk)
+            futures = {}
+            for job in jobs:
+                file_obj, local_path, filename, _extra = job
+                if slow_path_bytes is not None and (file_obj.size or 0) > slow_path_bytes:
+                    slow_futures[slow_executor.submit(
+                        _extract_file_text, str(local_path), filename, text_length_threshold)] = job
+                else:
+                    futures[executor.submit(
+                        _extract_file_text, str(local_path), filename, text_length_threshold)] = job
+            # handle results as they finish, so one slow OCR job doesn't hold up the rest
+            for future in as_completed(futures):
+                handle_result(future, futures[future])
+            for future in [f for f in slow_futures if f.done()]:
+                handle_result(future, slow_futures.pop(future))
+        for future in as_completed(slow_futures):
+            handle_result(future, slow_futures[future])
+
+    if pending:
+        flush_pending()
+    if emb_cache is not None:
+        emb_cache.close()
 
 def process_files_given_tag(
     filing_code_tag: str,
@@ -394,7 +1216,8 @@ def process_files_given_tag(
     max_size_mb: Optional[float] = DEFAULT_MAX_SIZE_MB,
     text_length_threshold: int = DEFAULT_TEXT_LENGTH_THRESHOLD,
     tesseract_cmd: Optional[str] = None,
-    apply_exclusions: bool = True
+    apply_exclusions: bool = True,
+    max_workers: Optional[int] = None
 ):
     """Main end-to-end pipeline: extract, embed, and label files for a filing tag.
 
@@ -404,9 +1227,9 @@ def process_files_given_tag(
       3. Connect to DB and retrieve FilingTag
       4. Query matching files
       5. For each file:
-         a. Copy to temp dir
-         b. Select extractor or fallback to Tika
-         c. Extract, clean, normalize text
+         a. Stage a local copy only if the extractor needs one (in a worker process)
+         b. Select extractor or fallback to Tika (in a worker process)
+         c. Extract, clean, normalize text (in a worker process)
          d. Generate embedding
          e. Save embedding & apply tag label
       6. Continue on errors without halting batch
@@ -420,28 +1243,36 @@ def process_files_given_tag(
         max_size_mb (Optional[float]): Max file size filter
         text_length_threshold (int): Minimum text length to embed
         tesseract_cmd (Optional[str]): Path to Tesseract executable
+        max_workers (Optional[int]): Extraction worker processes (default: CPU count)
     """
     engine = get_db_engine()
-    with Session(engine) as session:
-        tag = FilingTag.retrieve_tag_by_label(session, filing_code_tag)
+    # files stream from their own session, since the pipeline commits on `session`
+    with Session(engine) as session, Session(engine) as read_session:
+        tag_cache = FilingTagCache(session)
+        tag = tag_cache.get(filing_code_tag)
         if not tag:
             logging.getLogger('add_files_pipeline').error(
                 f"Tag '{filing_code_tag}' not found in DB.")
             return
+        tag_label = tag.label
         files = get_files_from_tagged_locations_query(
-            session, tag, n=n, randomize=randomize,
+            read_session, tag, n=n, randomize=randomize,
             exclude_embedded=exclude_embedded, max_size_mb=max_size_mb
-        ).all()
+        ).yield_per(FILE_CHUNK_SIZE)
         _run_file_pipeline(
             files,
             file_server_location,
             session,
-            MiniLMEmbedder(),
+            MiniLMEmbedder(dtype='bf16'),
             tesseract_cmd,
             text_length_threshold,
-            locator_fn=lambda _s, f, m: _locate_for_tag(f, m, tag),
-            labeling_fn=_label_for_tag,
-            apply_exclusions=apply_exclusions
+            # pass the label, not the FilingTag: it is re-resolved from tag_cache per
+            # batch, so no ORM instance outlives the per-batch commits on `session`
+            locator_fn=lambda _s, f, m: _locate_for_tag(f, m, tag_label),
+            tags_fn=lambda f, t: [t],
+            tag_cache=tag_cache,
+            apply_exclusions=apply_exclusions,
+            max_workers=max_workers
         )
 
 def process_files_given_file_server_location(
@@ -452,7 +1283,8 @@ def process_files_given_file_server_location(
     max_size_mb: Optional[float] = DEFAULT_MAX_SIZE_MB,
     text_length_threshold: int = DEFAULT_TEXT_LENGTH_THRESHOLD,
     tesseract_cmd: Optional[str] = None,
-    apply_exclusions: bool = True
+    apply_exclusions: bool = True,
+    max_workers: Optional[int] = None
 ):
     """
     Main pipeline: extract, embed, and label files based on a server location.
@@ -462,9 +1294,9 @@ def process_files_given_file_server_location(
       2. Instantiate MiniLM embedder
       3. Connect to DB and query files under the given server dirs
       4. For each file:
-         a. Copy to a temporary workspace
-         b. Select a specialized extractor or fallback to Tika
-         c. Extract text, then clean and normalize it
+         a. Stage a local copy only if the extractor needs one (in a worker process)
+         b. Select a specialized extractor or fallback to Tika (in a worker process)
+         c. Extract text, then clean and normalize it (in a worker process)
          d. Generate an embedding vector
          e. Save the embedding and apply default + inferred tags
       5. Continue processing even if individual files error
@@ -476,23 +1308,28 @@ def process_files_given_file_server_location(
         max_size_mb (Optional[float]): Maximum file size (in MB) to include.
         text_length_threshold (int): Minimum character length for extracted text.
         tesseract_cmd (Optional[str]): Path to tesseract executable for OCR.
+        max_workers (Optional[int]): Extraction worker processes (default: CPU count).
     """
     engine = get_db_engine()
-    with Session(engine) as session:
+    # files stream from their own session, since the pipeline commits on `session`
+    with Session(engine) as session, Session(engine) as read_session:
         target_dirs = extract_server_dirs(full_path=file_server_location,
                                           base_mount=mount)
         files = get_files_from_server_locations_query(
-            session, target_dirs, n=n,
+            read_session, target_dirs, n=n,
             exclude_embedded=exclude_embedded, max_size_mb=max_size_mb
-        ).all()
+        ).yield_per(FILE_CHUNK_SIZE)
+        tag_cache = FilingTagCache(session)
         _run_file_pipeline(
             files=files,
             server_mount=mount,
             session=session,
-            embedding_client=MiniLMEmbedder(),
+            embedding_client=MiniLMEmbedder(dtype='bf16'),
             tesseract_cmd=tesseract_cmd,
             text_length_threshold=text_length_threshold,
-            locator_fn=lambda _s, f, m: _locate_for_location(_s, f, m, target_dirs),
-            labeling_fn=_label_for_location,
-            apply_exclusions=apply_exclusions
+            locator_fn=lambda _s, f, m: _locate_for_location(_s, f, m, target_dirs, tag_cache),
+            tags_fn=lambda f, tags: tags,
+            tag_cache=tag_cache,
+            apply_exclusions=apply_exclusions,
+            max_workers=max_workers
         )
\ No newline at end of file
@@ -1,12 +1,17 @@
 # pipeline/date_mentions_pipeline.py
 
 import logging
+import multiprocessing as mp
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from itertools import batched
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
-from sqlalchemy import func, or_
+from sqlalchemy import delete, exists, func, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from db import get_db_engine
@@ -17,15 +22,30 @@ from utils import extract_server_dirs
 # Match the logger name with what's configured in the CLI
 logger = logging.getLogger('pipeline.date_mentions_pipeline')
 
+# Rows fetched per round-trip when streaming file texts
+STREAM_BATCH_SIZE = 1000
+
+# Files whose dates are counted in parallel and upserted together
+DATE_BATCH_SIZE = 500
+
+# Shared default extractor (its patterns are compiled once, at class definition);
+# each worker process builds its own on import
+_DATE_EXTRACTOR = DateExtractor()
+
 def get_files_with_text_in_server_location(
     db_session: Session,
     server_dirs: str | Path,
     n: Optional[int] = None,
     randomize: bool = False,
-    ) -> List[Tuple[File, FileContent]]:
+    ) -> Iterator[Tuple[str, str]]:
     """
     Get files with extracted text in the specified server location (from FileContent table).
 
+    Rows are streamed with a server-side cursor as plain (file_hash, source_text)
+    tuples; no ORM objects are built, so memory stays flat however many files match.
+    Because the cursor lives in db_session's transaction, don't commit on that
+    session while iterating.
+
     Parameters
     ----------
     db_session : Session
@@ -39,35 +59,109 @@ def get_files_with_text_in_server_location(
 
     Returns
     -------
-    List[Tuple[File, FileContent]]
-        List of (File, FileContent) tuples for files with text in the specified location
+    Iterator[Tuple[str, str]]
+        (file_hash, source_text) for each file with text in the specified location
     """
     server_dirs_str = str(server_dirs).rstrip('/')
     files_located_in_dir = or_(
         FileLocation.file_server_directories == server_dirs_str,
         FileLocation.file_server_directories.startswith(server_dirs_str + '/')
     )
-    
-    # Query files in the location that have text in FileContent
-    q = db_session.query(File, FileContent)\
-        .join(FileLocation, File.id == FileLocation.file_id)\
+
+    # Files in the location that have text in FileContent; EXISTS rather than a
+    # join so a file with several locations in the directory is returned once
+    stmt = select(File.hash, FileContent.source_text)\
         .join(FileContent, File.hash == FileContent.file_hash)\
-        .filter(files_located_in_dir)\
-        .filter(FileContent.source_text.isnot(None))\
-        .filter(func.length(FileContent.source_text) > 0)
-    
+        .where(exists().where(FileLocation.file_id == File.id, files_located_in_dir))\
+        .where(FileContent.has_text())
+
     if randomize:
-        q = q.order_by(func.random())
+        stmt = stmt.order_by(func.random())
     if n is not None:
-        q = q.limit(n)
-        
-    return q.all()
+        stmt = stmt.limit(n)
+
+    return db_session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE)).tuples()
+
+def count_date_mentions(source_text: str, date_extractor: Optional[DateExtractor] = None) -> Counter:
+    """
+    Count the date mentions in a document's text.
+
+    Parameters
+    ----------
+    source_text : str
+        The file's extracted text (FileContent.source_text)
+    date_extractor : Optional[DateExtractor], default=None
+        Extractor used to find date mentions in the text; defaults to a
+        shared DateExtractor with default settings
+
+    Returns
+    -------
+    Counter
+        Number of mentions of each date
+    """
+    return Counter((date_extractor or _DATE_EXTRACTOR)(source_text))
+
+def save_date_mentions(
+    db_session: Session,
+    file_counts: list[Tuple[str, Counter]],
+    replace_hashes: Optional[list[str]] = None
+) -> int:
+    """
+    Upsert date-mention counts for several files and commit.
+
+    All rows go out in one executemany INSERT ... ON CONFLICT DO UPDATE; rows
+    that already exist get the new count.
+
+    Parameters
+    ----------
+    db_session : Session
+        Active SQLAlchemy session
+    file_counts : list[Tuple[str, Counter]]
+        (file_hash, mentions per date) for each file
+    replace_hashes : Optional[list[str]], default=None
+        Files whose existing regex-basic mentions are deleted first, in one
+        DELETE in the same transaction, so dates no longer found don't linger
+        after reprocessing
+
+    Returns
+    -------
+    int
+        Number of date mention rows written
+    """
+    rows = [
+        dict(
+            file_hash=file_hash,
+            mention_date=mentioned_date,
+            mentions_count=mentions_count,
+            granularity='day',  # Default - could be enhanced to detect partial dates
+            extractor='regex-basic'
+        )
+        for file_hash, date_counts in file_counts
+        for mentioned_date, mentions_count in date_counts.items()
+    ]
+    if replace_hashes:
+        db_session.execute(
+            delete(FileDateMention)
+            .where(FileDateMention.file_hash.in_(replace_hashes))
+            .where(FileDateMention.extractor == 'regex-basic')
+        )
+    if not rows:
+        db_session.commit()
+        return 0
+    stmt = pg_insert(FileDateMention)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['file_hash', 'mention_date', 'granularity'],
+        set_={'mentions_count': stmt.excluded.mentions_count, 'extracted_at': func.now()}
+    )
+    db_session.execute(stmt, rows)
+    db_session.commit()
+    return len(rows)
 
 def extract_and_save_date_mentions(
     db_session: Session,
-    file: File,
-    content: FileContent,
-    date_extractor: DateExtractor
+    file_hash: str,
+    source_text: str,
+    date_extractor: Optional[DateExtractor] = None
 ) -> int:
     """
     Extract dates from document text (from FileContent) and save them to the file_date_mentions table.
@@ -76,74 +170,59 @@ def extract_and_save_date_mentions(
     ----------
     db_session : Session
         Active SQLAlchemy session
-    file : File
-        File ORM object
-    content : FileContent
-        FileContent ORM object with source_text
-    
+    file_hash : str
+        Hash of the file the text belongs to
+    source_text : str
+        The file's extracted text (FileContent.source_text)
+    date_extractor : Optional[DateExtractor], default=None
+        Extractor used to find date mentions in the text; defaults to a
+        shared DateExtractor with default settings
+
     Returns
     -------
     int
         Number of date mentions extracted and saved
     """
-    if not content.source_text:
-        logger.warning(f"No text to extract dates from for file {file.hash}")
+    if not source_text:
+        logger.warning(f"No text to extract dates from for file {file_hash}")
         return 0
 
-    # Extract dates from text using DateExtractor
-    date_hits = date_extractor(content.source_text)
-    if not date_hits:
-        logger.debug(f"No dates found in text for file {file.hash}")
+    date_counts = count_date_mentions(source_text, date_extractor)
+    if not date_counts:
+        logger.debug(f"No dates found in text for file {file_hash}")
         return 0
 
-    # Count occurrences of each date
-    date_counts = {}
-    for mentioned_date in date_hits:
-        if mentioned_date not in date_counts:
-            date_counts[mentioned_date] = 0
-        date_counts[mentioned_date] += 1
-
-    # Save to database
-    count = 0
-    for mentioned_date, mentions_count in date_counts.items():
-        # Check if this date mention already exists for the file
-        existing = db_session.query(FileDateMention).filter(
-            FileDateMention.file_hash == file.hash,
-            FileDateMention.mention_date == mentioned_date
-        ).first()
-
-        if existing:
-            # Update count if it already exists
-            existing.mentions_count = mentions_count
-            existing.extracted_at = func.now()
-        else:
-            # Create new record
-            mention = FileDateMention(
-                file_hash=file.hash,
-                mention_date=mentioned_date,
-                mentions_count=mentions_count,
-                granularity='day',  # Default - could be enhanced to detect partial dates
-                extractor='regex-basic'
-            )
-            db_session.add(mention)
-
-        count += 1
-
-    # Commit the changes
-    if count > 0:
-        db_session.commit()
-        logger.info(f"Saved {count} date mentions for file {file.hash}")
-
+    count = save_date_mentions(db_session, [(file_hash, date_counts)])
+    logger.info(f"Saved {count} date mentions for file {file_hash}")
     return count
 
+def _count_dates_worker(row: Tuple[str, str]) -> Tuple[str, Optional[Counter], Optional[str]]:
+    """
+    ProcessPoolExecutor task: count one file's date mentions.
+
+    Returns (file_hash, counts, error); errors are returned rather than
+    raised so one bad text doesn't abort the batch.
+    """
+    file_hash, source_text = row
+    try:
+        return file_hash, count_date_mentions(source_text), None
+    except Exception as e:
+        return file_hash, None, str(e)
+
 def process_date_mentions_for_server_location(
     server_location: str,
     mount: str,
     limit: Optional[int] = None,
-    randomize: bool = False
+    randomize: bool = False,
+    max_workers: Optional[int] = None
 ) -> Tuple[int, int]:
     """
     Extract date mentions from files in a specified server location.
+
+    Texts are streamed from the database in batches of DATE_BATCH_SIZE; each
+    batch's dates are counted across a pool of worker processes, its files'
+    previous mentions cleared with one DELETE and the new ones written with
+    one upsert.
     
     Parameters
     ----------
@@ -155,6 +234,8 @@ def process_date_mentions_for_server_location(
         Maximum number of files to process
     randomize : bool, default=False
         Whether to randomize the order of files
+    max_workers : Optional[int], default=None
+        Number of extraction worker processes (default: CPU count)
     
     Returns
     -------
@@ -167,34 +248,44 @@ def process_date_mentions_for_server_location(
     files_processed = 0
     total_date_mentions = 0
     
-    with Session(engine) as session:
+    # texts stream from their own session, since mentions are committed on `session`
+    with Session(engine) as session, Session(engine) as read_session, ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=mp.get_context('spawn')
+    ) as executor:
         # Extract the server directory path relative to mount
         target_dirs = extract_server_dirs(full_path=server_location, base_mount=mount)
         logger.info(f"Target directories: {target_dirs}")
         
         # Get files with text in the target location
-        file_contents = get_files_with_text_in_server_location(
-            session, target_dirs, n=limit, randomize=randomize
+        file_texts = get_files_with_text_in_server_location(
+            read_session, target_dirs, n=limit, randomize=randomize
         )
         
-        logger.info(f"Found {len(file_contents)} files with extracted text")
-        dt_extractor = DateExtractor()
-        # Process each file
-        for file, content in file_contents:
-            try:
-                date_count = extract_and_save_date_mentions(db_session=session,
-                                                            file=file,
-                                                            content=content,
-                                                            date_extractor=dt_extractor)
-                total_date_mentions += date_count
+        # Process files a batch at a time, so only one batch of texts is held in memory
+        for batch in batched(file_texts, DATE_BATCH_SIZE):
+            file_counts = []
+            processed_hashes = []
+            for file_hash, date_counts, error in executor.map(_count_dates_worker, batch, chunksize=16):
+                if error:
+                    logger.error(f"Error processing file {file_hash}: {error}")
+                    continue
                 files_processed += 1
-                
-                if files_processed % 100 == 0:
-                    logger.info(f"Processed {files_processed}/{len(file_contents)} files")
-                    
+                processed_hashes.append(file_hash)
+                if date_counts:
+                    file_counts.append((file_hash, date_counts))
+                else:
+                    logger.debug(f"No dates found in text for file {file_hash}")
+            try:
+                # mentions are derived data and can be recomputed, so don't wait
+                # for the WAL flush on each batch's commit
+                session.execute(text("SET LOCAL synchronous_commit = off"))
+                # reprocessed files get exactly the mentions found this time
+                total_date_mentions += save_date_mentions(session, file_counts, replace_hashes=processed_hashes)
             except Exception as e:
-                logger.error(f"Error processing file {file.hash}: {str(e)}")
-                continue
+                session.rollback()
+                logger.error(f"Error saving date mentions for {len(file_counts)} files: {str(e)}")
+            logger.info(f"Processed {files_processed} files")
     
     logger.info(f"Completed processing {files_processed} files, found {total_date_mentions} date mentions")
     return files_processed, total_date_mentions
@@ -1,4 +1,5 @@
 # sync_tables.py
+import argparse
 from psycopg import connect
 from tqdm import tqdm
 from dotenv import load_dotenv
@@ -15,26 +16,31 @@ DST_DSN = (
     f"@{os.getenv('PROJECT_DB_HOST')}:{os.getenv('PROJECT_DB_PORT')}/{os.getenv('PROJECT_DB_NAME')}"
 )
 
-BATCH = 10_000
-
+# Each table is COPYed into a temp staging table (stg_<table>), then merged
+# into the target with one set-based INSERT ... SELECT ... ON CONFLICT.
 TABLES = [
     (
         "files",
+        ("id", "size", "hash", "extension"),
         # ── hash is the business key ──────────────────────────────
         """INSERT INTO files (id, size, hash, extension)
-           VALUES (%(id)s, %(size)s, %(hash)s, %(extension)s)
+           SELECT id, size, hash, extension FROM stg_files
            ON CONFLICT (hash) DO UPDATE
              SET size      = EXCLUDED.size,
                  extension = EXCLUDED.extension"""
     ),
     (
         "file_locations",
+        ("id", "file_id", "existence_confirmed", "hash_confirmed",
+         "file_server_directories", "filename"),
+        # only locations whose file_id exists in the destination files table
         """INSERT INTO file_locations
              (id, file_id, existence_confirmed, hash_confirmed,
               file_server_directories, filename)
-           VALUES (%(id)s, %(file_id)s, %(existence_confirmed)s,
-                   %(hash_confirmed)s, %(file_server_directories)s,
-                   %(filename)s)
+           SELECT s.id, s.file_id, s.existence_confirmed, s.hash_confirmed,
+                  s.file_server_directories, s.filename
+             FROM stg_file_locations s
+            WHERE EXISTS (SELECT 1 FROM files f WHERE f.id = s.file_id)
            ON CONFLICT (id) DO UPDATE SET
              file_id              = EXCLUDED.file_id,
              existence_confirmed  = EXCLUDED.existence_confirmed,
@@ -44,75 +50,150 @@ TABLES = [
     ),
 ]
 
+# Secondary indexes dropped for a table's bulk merge and rebuilt afterwards when
+# the sync runs with --reindex; one index build is far cheaper than maintaining
+# them row by row (GIN especially). DROP INDEX takes an ACCESS EXCLUSIVE lock on
+# the table that is held until the sync commits it, blocking every reader
+# (including the add-files pipeline's directory lookups) for the merge and
+# rebuild, so it is opt-in and meant for large initial loads in a quiet window.
+REBUILT_INDEXES = {
+    "file_locations": ("ix_file_locations_dirs_trgm", "ix_file_locations_dirs_pattern"),
+}
+
+# ──────────────────────────────────────────────────────────────────────────────
+def drop_secondary_indexes(dst_cur, table):
+    """Drop table's REBUILT_INDEXES and return their definitions for rebuilding."""
+    names = list(REBUILT_INDEXES.get(table, ()))
+    if not names:
+        return []
+    dst_cur.execute(
+        """SELECT indexname, indexdef FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = %s
+              AND indexname = ANY(%s)""",
+        (table, names),
+    )
+    index_defs = dst_cur.fetchall()
+    for name, _ in index_defs:
+        dst_cur.execute(f"DROP INDEX {name}")
+    return [indexdef for _, indexdef in index_defs]
+
 # ──────────────────────────────────────────────────────────────────────────────
-def stream_and_upsert(src_cur, dst_cur, table, upsert_sql):
-    src_cur.execute(f"SELECT COUNT(*) FROM {table}")
-    total = src_cur.fetchone()[0]
-    bar   = tqdm(total=total, desc=f"Sync {table}")
-
-    src_cur = src_cur.connection.cursor(name=f"stream_{table}")
-    src_cur.execute(f"SELECT * FROM {table} ORDER BY id")
-
-    cols = [c.name for c in src_cur.description]
-
-    # For file_locations, pre-fetch all valid file IDs from destination
-    # Valid file IDs are those that exist in the files table
-    valid_file_ids = set()
-    if table == "file_locations":
-        dst_cur.execute("SELECT id FROM files")
-        valid_file_ids = {row[0] for row in dst_cur.fetchall()}
-        print(f"\nFound {len(valid_file_ids)} valid file IDs in destination database")
-
-    while rows := src_cur.fetchmany(BATCH):
-        dict_rows = [dict(zip(cols, r)) for r in rows]
-        
-        # Filter out file_locations with invalid file_id references
-        if table == "file_locations":
-            original_count = len(dict_rows)
-            dict_rows = [row for row in dict_rows if row['file_id'] in valid_file_ids]
-            skipped = original_count - len(dict_rows)
-            if skipped > 0:
-                print(f"Skipped {skipped} file_locations with invalid file_id references")
-        
-        if dict_rows:  # Only execute if we have rows to process
-            dst_cur.executemany(upsert_sql, dict_rows)
-        
-        bar.update(len(rows))  # Update progress bar based on source rows processed
-
-        # after each batch of *files* refresh hash in child tables
-        if table == "files":
-                dst_cur.execute(
-                        """
-                        UPDATE file_contents fc
-                            SET file_hash = f.hash
-                            FROM files f
-                            WHERE fc.file_hash = f.hash
-                                AND fc.file_hash IS NULL;
-                        UPDATE file_tag_labels tl
-                            SET file_hash = f.hash
-                            FROM files f
-                            WHERE tl.file_id = f.id
-                                AND tl.file_hash IS NULL;
-                        """
-                )
+def column_types(cur, table, cols):
+    """Map each of cols that table has to its type name (information_schema udt_name)."""
+    cur.execute(
+        """SELECT column_name, udt_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s
+              AND column_name = ANY(%s)""",
+        (table, list(cols)),
+    )
+    return dict(cur.fetchall())
+
+def copy_format(src_cur, dst_cur, table, cols):
+    """Pick the COPY format for table: BINARY only when every synced column has the same type on both sides.
+
+    Binary COPY data is only readable as the exact type it was written from, so
+    a column whose type has drifted (e.g. vector on one side, halfvec on the
+    other) would fail mid-stream with an opaque error. Such tables are copied
+    as TEXT instead, letting the destination's input functions convert values.
+    """
+    src_types = column_types(src_cur, table, cols)
+    dst_types = column_types(dst_cur, table, cols)
+    missing = [f"{col} (missing in {side})"
+               for side, types in (("source", src_types), ("destination", dst_types))
+               for col in cols if col not in types]
+    if missing:
+        raise ValueError(f"Cannot sync {table}: {', '.join(missing)}")
+    drift = [f"{col} {src_types[col]} -> {dst_types[col]}" for col in cols if src_types[col] != dst_types[col]]
+    if drift:
+        print(f"{table} column types differ ({', '.join(drift)}); copying as text instead of binary")
+        return "TEXT"
+    return "BINARY"
 
+# ──────────────────────────────────────────────────────────────────────────────
+def stream_and_upsert(src_cur, dst_cur, table, cols, merge_sql, reindex=False):
+    """COPY table from the source into staging and merge it into the destination.
+
+    With reindex, the table's REBUILT_INDEXES are dropped only once staging is
+    loaded and rebuilt right after the merge, so the exclusive lock covers the
+    merge and rebuild but not the copy from the source.
+    """
+    col_list = ", ".join(cols)
+
+    # session-local staging table with the target's column types
+    staging = f"stg_{table}"
+    dst_cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table} INCLUDING DEFAULTS)")
+    dst_cur.execute(f"TRUNCATE {staging}")
+
+    # Pipe the source table into staging as COPY data: the bytes pass straight
+    # through without becoming Python rows, and (when the column types match)
+    # without being formatted as text either.
+    # No ORDER BY: the ON CONFLICT merge doesn't care about row order, and
+    # dropping it lets the source stream a plain seq scan instead of walking the PK.
+    fmt = copy_format(src_cur, dst_cur, table, cols)
+    bar = tqdm(desc=f"Sync {table}", unit="B", unit_scale=True)
+    with src_cur.copy(f"COPY (SELECT {col_list} FROM {table}) TO STDOUT (FORMAT {fmt})") as copy_out, \
+            dst_cur.copy(f"COPY {staging} ({col_list}) FROM STDIN (FORMAT {fmt})") as copy_in:
+        for data in copy_out:
+            copy_in.write(data)
+            bar.update(len(data))
     bar.close()
+    dst_cur.execute(f"SELECT count(*) FROM {staging}")
+    staged = dst_cur.fetchone()[0]
+
+    # dropped and rebuilt in the caller's transaction, so a failed sync keeps them
+    index_defs = drop_secondary_indexes(dst_cur, table) if reindex else []
+    # one set-based merge for the whole table (the sync commits per table anyway)
+    dst_cur.execute(merge_sql)
+    merged = dst_cur.rowcount
+    for indexdef in index_defs:
+        dst_cur.execute(indexdef)
+    print(f"Merged {merged} of {staged} {table} rows")
+
+    # Report file_locations with invalid file_id references (filtered out by the merge)
+    if table == "file_locations" and staged > merged:
+        print(f"Skipped {staged - merged} file_locations with invalid file_id references")
+    dst_cur.execute(f"TRUNCATE {staging}")
+
+# ──────────────────────────────────────────────────────────────────────────────
+def refresh_child_hashes(dst_cur):
+    """Backfill file_hash on child rows keyed by file_id, once all files are synced.
+
+    file_contents is keyed by file_hash alone (no file_id), so there is
+    nothing to backfill there.
+    """
+    dst_cur.execute(
+            """
+            UPDATE file_tag_labels tl
+                SET file_hash = f.hash
+                FROM files f
+                WHERE tl.file_id = f.id
+                    AND tl.file_hash IS NULL;
+            """
+    )
 
 # ──────────────────────────────────────────────────────────────────────────────
-def main():
+def main(reindex=False):
     with connect(SRC_DSN) as src_conn, connect(DST_DSN) as dst_conn:
         dst_conn.autocommit = False
         src_cur = src_conn.cursor()
         dst_cur = dst_conn.cursor()
 
         # order matters: files first (parent), then file_locations (child)
-        for table, sql in TABLES:
-            stream_and_upsert(src_cur, dst_cur, table, sql)
+        for table, cols, sql in TABLES:
+            stream_and_upsert(src_cur, dst_cur, table, cols, sql, reindex=reindex)
+            if table == "files":
+                # one set-based join over all files rather than one per batch
+                refresh_child_hashes(dst_cur)
             dst_conn.commit()       # keep WAL small, visible progress
 
         src_cur.close()
         dst_cur.close()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Sync files and file_locations from the app DB into the project DB.")
+    parser.add_argument("--reindex", action="store_true",
+                        help="drop secondary indexes for the merge and rebuild them after (faster for large "
+                             "loads, but locks file_locations against all readers until the table commits)")
+    args = parser.parse_args()
+    main(reindex=args.reindex)
 
@@ -0,0 +1,79 @@
+# test_add_files_pipeline.py
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from pipeline import add_files_pipeline as afp
+
+
+class _FakeEmbedder:
+    """Returns a distinct vector per text and records what it was asked to encode."""
+    model_name = "fake-minilm"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return [np.full(4, float(len(t)), dtype=np.float32) for t in texts]
+
+
+class _FakeSession:
+    """Captures the rows of the FileContent insert."""
+    def __init__(self):
+        self.rows = []
+
+    def execute(self, stmt, rows=None):
+        self.rows.extend(rows or [])
+
+
+def _pending(file_hash, text):
+    return afp._PendingEmbedding(file_obj=SimpleNamespace(hash=file_hash),
+                                 local_path=Path(f"/{file_hash}.txt"), text=text, extra=None)
+
+
+def test_flush_batch_encodes_identical_texts_once(monkeypatch):
+    monkeypatch.setattr(afp, "_has_text_hash_column", lambda session: True)
+    monkeypatch.setattr(afp, "_stored_vectors", lambda session, model, digests: {})
+    embedder, session = _FakeEmbedder(), _FakeSession()
+
+    pending = [_pending("a", "same text"), _pending("b", "other"), _pending("c", "same text")]
+    stored = afp._flush_batch(pending, session, embedder)
+
+    assert [item.file_obj.hash for item in stored] == ["a", "b", "c"]
+    assert sorted(embedder.encoded) == ["other", "same text"]
+    rows = {row["file_hash"]: row for row in session.rows}
+    assert rows["a"]["source_text_hash"] == rows["c"]["source_text_hash"] == afp._text_digest("same text")
+    assert np.array_equal(rows["a"]["minilm_emb"], rows["c"]["minilm_emb"])
+
+
+def test_flush_batch_reuses_stored_vector(monkeypatch):
+    stored_vec = np.arange(4, dtype=np.float32)
+    digest = afp._text_digest("already stored")
+    monkeypatch.setattr(afp, "_has_text_hash_column", lambda session: True)
+    monkeypatch.setattr(afp, "_stored_vectors",
+                        lambda session, model, digests: {digest: stored_vec} if digest in digests else {})
+    embedder, session = _FakeEmbedder(), _FakeSession()
+
+    afp._flush_batch([_pending("a", "already stored"), _pending("b", "new")], session, embedder)
+
+    assert embedder.encoded == ["new"]
+    rows = {row["file_hash"]: row for row in session.rows}
+    assert np.array_equal(rows["a"]["minilm_emb"], stored_vec.astype(np.float16))
+
+
+def test_flush_batch_without_digest_column(monkeypatch):
+    def no_lookup(*args):
+        raise AssertionError("stored vectors looked up without source_text_hash")
+
+    monkeypatch.setattr(afp, "_has_text_hash_column", lambda session: False)
+    monkeypatch.setattr(afp, "_stored_vectors", no_lookup)
+    embedder, session = _FakeEmbedder(), _FakeSession()
+
+    afp._flush_batch([_pending("a", "same text"), _pending("b", "same text")], session, embedder)
+
+    assert embedder.encoded == ["same text"]
+    assert len(session.rows) == 2
+    assert all("source_text_hash" not in row for row in session.rows)
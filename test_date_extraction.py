@@ -3,10 +3,10 @@
 import logging
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from db import get_db_engine
-from db.models import FileDateMention, File, FileContent
+from db.models import FileDateMention, FileContent
 from pipeline.date_mentions_pipeline import extract_and_save_date_mentions
 
 # Load environment variables
@@ -24,28 +24,29 @@ def test_date_extraction():
     engine = get_db_engine()
     
     with Session(engine) as session:
-        # Find a file with text content
-        file_with_text = session.query(File, FileContent)\
-            .join(FileContent, File.hash == FileContent.file_hash)\
-            .filter(FileContent.source_text.isnot(None))\
-            .order_by(func.random())\
-            .first()
+        # Find a file with text content (just its hash and text; no ORM objects needed)
+        file_with_text = session.execute(
+            select(FileContent.file_hash, FileContent.source_text)
+            .where(FileContent.source_text.isnot(None))
+            .order_by(func.random())
+            .limit(1)
+        ).first()
             
         if not file_with_text:
             logger.error("No files with text found in database")
             return
             
-        file, content = file_with_text
+        file_hash, source_text = file_with_text
         
         # Delete any existing date mentions for this file to start fresh
         session.query(FileDateMention)\
-            .filter(FileDateMention.file_hash == file.hash)\
+            .filter(FileDateMention.file_hash == file_hash)\
             .delete()
         session.commit()
 
         # Extract and save date mentions
-        logger.info(f"Testing date extraction for file hash: {file.hash}")
-        date_count = extract_and_save_date_mentions(session, file, content)
+        logger.info(f"Testing date extraction for file hash: {file_hash}")
+        date_count = extract_and_save_date_mentions(session, file_hash, source_text)
 
         # Verify results
         if date_count > 0:
@@ -53,7 +54,7 @@ def test_date_extraction():
 
             # Show the extracted dates
             date_mentions = session.query(FileDateMention)\
-                .filter(FileDateMention.file_hash == file.hash)\
+                .filter(FileDateMention.file_hash == file_hash)\
                 .all()
 
             logger.info("Extracted dates:")
@@ -24,6 +24,12 @@ project_db_dict = dict(
     password=os.getenv("PROJECT_DB_PASSWORD"),
 )
 
+# Seconds allowed to connect and for each probe query, so a wedged server fails the test instead of hanging it
+PROBE_TIMEOUT_S = 5
+
+# Extensions reported by the access test; passed as a parameter so the query text stays fixed
+RELEVANT_EXTENSIONS = ('vector', 'pg_trgm', 'btree_gin', 'btree_gist')
+
 def test_connection_and_info(cfg: dict, role: str) -> bool:
     """Test connection and print database information."""
     print(f"\n{'='*60}")
@@ -34,55 +40,64 @@ def test_connection_and_info(cfg: dict, role: str) -> bool:
     print(f"User: {cfg['user']}")
     
     try:
-        with psycopg.connect(**cfg) as conn:
-            with conn.cursor() as cur:
-                # Basic connection test
-                cur.execute("SELECT 1;")
-                print("✓ Connection successful")
-                
+        # autocommit: read-only probes, no BEGIN/COMMIT round-trips around them;
+        # the timeout is set at connect time (startup options), so it costs no extra query
+        with psycopg.connect(
+            **cfg,
+            autocommit=True,
+            connect_timeout=PROBE_TIMEOUT_S,
+            options=f"-c statement_timeout={PROBE_TIMEOUT_S * 1000}",
+        ) as conn:
+            # Basic connection test (a failed connect raises before this)
+            print("✓ Connection successful")
+
+            # Send every probe in one pipeline: a single network round-trip instead
+            # of one per query. Each gets its own cursor so no result is overwritten.
+            with conn.pipeline():
                 # Database version
-                cur.execute("SELECT version();")
-                version = cur.fetchone()[0]
-                print(f"✓ PostgreSQL Version: {version}")
-                
+                version_cur = conn.execute("SELECT version();")
                 # Current database size
-                cur.execute("""
+                size_cur = conn.execute("""
                     SELECT pg_size_pretty(pg_database_size(current_database()));
                 """)
-                db_size = cur.fetchone()[0]
-                print(f"✓ Database Size: {db_size}")
-                
                 # List tables and their row counts
-                cur.execute("""
+                tables_cur = conn.execute("""
                     SELECT schemaname, relname, n_tup_ins - n_tup_del as row_count
                     FROM pg_stat_user_tables 
                     ORDER BY schemaname, relname;
                 """)
-                tables = cur.fetchall()
-                
-                if tables:
-                    print(f"✓ Tables ({len(tables)} found):")
-                    for schema, table, rows in tables:
-                        print(f"  • {schema}.{table}: {rows:,} rows")
-                else:
-                    print("✓ No user tables found")
-                
                 # Check for specific extensions (useful for pgvector)
-                cur.execute("""
+                extensions_cur = conn.execute("""
                     SELECT extname, extversion 
                     FROM pg_extension 
-                    WHERE extname IN ('vector', 'pg_trgm', 'btree_gin', 'btree_gist')
+                    WHERE extname = ANY(%s)
                     ORDER BY extname;
-                """)
-                extensions = cur.fetchall()
+                """, (list(RELEVANT_EXTENSIONS),))
+
+            version = version_cur.fetchone()[0]
+            print(f"✓ PostgreSQL Version: {version}")
+
+            db_size = size_cur.fetchone()[0]
+            print(f"✓ Database Size: {db_size}")
+
+            tables = tables_cur.fetchall()
+            
+            if tables:
+                print(f"✓ Tables ({len(tables)} found):")
+                for schema, table, rows in tables:
+                    print(f"  • {schema}.{table}: {rows:,} rows")
+            else:
+                print("✓ No user tables found")
+            
+            extensions = extensions_cur.fetchall()
+            
+            if extensions:
+                print("✓ Relevant Extensions:")
+                for ext_name, ext_version in extensions:
+                    print(f"  • {ext_name} v{ext_version}")
+            else:
+                print("✓ No relevant extensions found")
                 
-                if extensions:
-                    print("✓ Relevant Extensions:")
-                    for ext_name, ext_version in extensions:
-                        print(f"  • {ext_name} v{ext_version}")
-                else:
-                    print("✓ No relevant extensions found")
-                    
     except OperationalError as err:
         print(f"✗ Connection failed: {err}")
         return False
@@ -0,0 +1,112 @@
+# test_image_extraction.py
+
+import importlib
+import sys
+import types
+
+from PIL import Image
+
+
+class _Enum:
+    """Mirrors tesserocr's enum base: constants live on the class, and it can't be instantiated."""
+    def __init__(self):
+        raise TypeError(f"{type(self).__name__} cannot be instantiated")
+
+
+class _PSM(_Enum):
+    OSD_ONLY = 0
+    AUTO = 3
+    SINGLE_BLOCK = 6
+
+
+class _OEM(_Enum):
+    DEFAULT = 3
+
+
+class _FakeTessAPI:
+    """Records its constructor arguments; OSD reports a fixed clockwise orientation."""
+    created = []
+    orient_deg = 0
+
+    def __init__(self, lang="eng", psm=_PSM.AUTO, oem=_OEM.DEFAULT):
+        self.kwargs = dict(lang=lang, psm=psm, oem=oem)
+        self.ended = False
+        _FakeTessAPI.created.append(self)
+
+    def SetImage(self, img):
+        self.image = img
+
+    def SetSourceResolution(self, dpi):
+        self.dpi = dpi
+
+    def GetUTF8Text(self):
+        return "text"
+
+    def DetectOrientationScript(self):
+        return {"orient_deg": _FakeTessAPI.orient_deg}
+
+    def End(self):
+        self.ended = True
+
+
+def _load_image_extraction(monkeypatch):
+    """Import image_extraction against a fake tesserocr with the real enum behaviour."""
+    fake = types.ModuleType("tesserocr")
+    fake.PyTessBaseAPI = _FakeTessAPI
+    fake.PSM = _PSM
+    fake.OEM = _OEM
+    monkeypatch.setitem(sys.modules, "tesserocr", fake)
+    _FakeTessAPI.created = []
+    module = importlib.import_module("text_extraction.image_extraction")
+    return importlib.reload(module)
+
+
+def _sample_image():
+    """A non-square image with one marked corner, so any rotation changes its bytes."""
+    img = Image.new("RGB", (40, 20), "white")
+    img.putpixel((0, 0), (255, 0, 0))
+    return img
+
+
+def test_tesserocr_api_gets_int_modes(monkeypatch):
+    image_extraction = _load_image_extraction(monkeypatch)
+    extractor = image_extraction.ImageTextExtractor(psm=6, oem=3)
+    assert extractor.use_tesserocr
+
+    assert extractor._ocr(_sample_image()) == "text"
+    ocr_api = _FakeTessAPI.created[-1]
+    assert ocr_api.kwargs == dict(lang="eng", psm=6, oem=3)
+
+    extractor.close()
+    assert ocr_api.ended
+
+
+def test_close_without_apis(monkeypatch):
+    image_extraction = _load_image_extraction(monkeypatch)
+    extractor = image_extraction.ImageTextExtractor()
+    extractor.close()
+    extractor.close()
+
+    # __init__ failed before any state was set
+    half_built = image_extraction.ImageTextExtractor.__new__(image_extraction.ImageTextExtractor)
+    half_built.close()
+
+
+def test_osd_rotation_matches_pytesseract(monkeypatch):
+    image_extraction = _load_image_extraction(monkeypatch)
+    tess_extractor = image_extraction.ImageTextExtractor()
+    cli_extractor = image_extraction.ImageTextExtractor(use_tesserocr=False)
+
+    for orient_deg in (0, 90, 180, 270):
+        _FakeTessAPI.orient_deg = orient_deg
+        # the CLI prints the clockwise correction for the same detection
+        rotate = (360 - orient_deg) % 360
+        monkeypatch.setattr(image_extraction.pytesseract, "image_to_osd",
+                            lambda img, rotate=rotate: f"Orientation in degrees: {orient_deg}\nRotate: {rotate}\n")
+
+        via_tesserocr = tess_extractor.detect_and_correct_orientation(_sample_image())
+        via_cli = cli_extractor.detect_and_correct_orientation(_sample_image())
+        assert via_tesserocr.size == via_cli.size
+        assert via_tesserocr.tobytes() == via_cli.tobytes()
+
+    tess_extractor.close()
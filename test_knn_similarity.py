@@ -0,0 +1,42 @@
+# test_knn_similarity.py
+
+import numpy as np
+import pytest
+
+from knn import base
+from knn.base import cosine_similarity_batch
+
+
+def _numpy_reference(query_vec, matrix):
+    """The plain NumPy computation cosine_similarity_batch must agree with."""
+    query_vec = np.asarray(query_vec, dtype=float)
+    matrix = np.asarray(matrix, dtype=float)
+    query_norm = np.linalg.norm(query_vec)
+    norms = np.linalg.norm(matrix, axis=1)
+    sims = np.zeros(matrix.shape[0])
+    valid = norms != 0.0
+    if query_norm != 0.0:
+        sims[valid] = matrix[valid] @ query_vec / (norms[valid] * query_norm)
+    return sims
+
+
+@pytest.mark.parametrize("rows", [1, 7, base._NUMBA_MAX_ROWS - 1, base._NUMBA_MAX_ROWS + 5])
+def test_matches_numpy_reference(rows):
+    rng = np.random.default_rng(rows)
+    matrix = rng.standard_normal((rows, 384)).astype(np.float32)
+    matrix[0] = 0.0  # zero rows score 0 rather than dividing by zero
+    query = rng.standard_normal(384).astype(np.float32)
+
+    np.testing.assert_allclose(cosine_similarity_batch(query, matrix),
+                               _numpy_reference(query, matrix), rtol=1e-12, atol=1e-12)
+
+
+def test_zero_query_scores_zero():
+    matrix = np.ones((3, 4))
+    assert np.array_equal(cosine_similarity_batch(np.zeros(4), matrix), np.zeros(3))
+
+
+@pytest.mark.parametrize("rows", [5, base._NUMBA_MAX_ROWS + 5])
+def test_dimension_mismatch_raises(rows):
+    with pytest.raises(ValueError):
+        cosine_similarity_batch(np.ones(383), np.ones((rows, 384)))
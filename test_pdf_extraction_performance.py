@@ -7,6 +7,8 @@ It can reuse a persistent file collection in the database for repeatable tests,
 Usage:
 	- Set environment variable PDF_PERF_TEST_N to control the number of PDFs (default: 10).
 	- Set PDF_SERVER_MOUNT if file paths require a mount prefix.
+	- Set PDF_PERF_TEST_WORKERS to benchmark files in parallel processes (default: 1, serial).
+	- Set PDF_PERF_TEST_VERBOSE=1 to print each file's timings as it finishes.
 	- The script will use a collection named 'perf_test_pdf_extract' if it exists, otherwise it will create one.
 
 Tables used: files, file_locations, file_collections, file_collection_members
@@ -14,39 +16,81 @@ Tables used: files, file_locations, file_collections, file_collection_members
 
 import dotenv
 import os
+import random
 import time
 from datetime import datetime
 from pathlib import Path
-from text_extraction.pdf_extraction import PDFTextExtractor, PDFTextExtractor2, PDFFile
+import fitz
+from text_extraction.pdf_extraction import PDFTextExtractor, PDFTextExtractor2
+import contextlib
 import csv
+import multiprocessing as mp
+from collections import Counter
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
 
 # --- DB imports ---
 from db import get_db_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import func
+from sqlalchemy.orm import aliased, selectinload, sessionmaker
+from sqlalchemy import exists, func, insert, select, tablesample, text
 from db.models import File, FileLocation, FileCollection, FileCollectionMember, Base
 
 dotenv.load_dotenv()
 
-def get_random_pdf_files_from_db(session, n=10):
+# Below this many estimated rows in files, plain ORDER BY random() is cheap enough
+SAMPLE_MIN_ROWS = 50_000
+
+# TABLESAMPLE percent from the last successful draw; reused so later calls skip retuning
+_sample_percent = None
+
+def _estimated_file_rows(session):
+	"""Planner row estimate for files (pg_class.reltuples); no table scan."""
+	return session.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'files'")).scalar() or 0
+
+def get_random_pdf_files_from_db(session, n=10, sample_percent=None):
 	"""
 	Query for n random PDF files with at least one valid location.
 
+	On large catalogs the files table is read through TABLESAMPLE SYSTEM, which
+	visits only a fraction of its pages instead of sorting the whole
+	files/file_locations join by random(). The percent is sized from the row
+	estimate so the sample holds comfortably more than n PDFs, doubled until it
+	does, and cached for later calls. Small tables use ORDER BY random().
+
 	Args:
 		session: SQLAlchemy session object.
 		n (int): Number of PDF files to return.
+		sample_percent (float, optional): Percent of files pages to sample; tuned automatically if None.
 
 	Returns:
 		list[File]: List of File ORM objects with .pdf extension and at least one location.
 	"""
-	pdf_files = session.query(File).join(FileLocation).filter(File.extension == 'pdf')\
-		.order_by(func.random())\
-		.limit(n)\
-		.all()
-	if not pdf_files:
-		return []
-	return list(pdf_files)
+	global _sample_percent
+	has_location = exists().where(FileLocation.file_id == File.id)
+	row_estimate = _estimated_file_rows(session)
+	if row_estimate < SAMPLE_MIN_ROWS:
+		return session.query(File).filter(File.extension == 'pdf', has_location)\
+			.options(selectinload(File.locations))\
+			.order_by(func.random())\
+			.limit(n)\
+			.all()
+
+	percent = sample_percent or _sample_percent or min(100.0, 100.0 * n * 20 / row_estimate)
+	while True:
+		sampled = aliased(File, tablesample(File.__table__, func.system(percent)))
+		pdf_files = session.query(sampled)\
+			.filter(sampled.extension == 'pdf', exists().where(FileLocation.file_id == sampled.id))\
+			.options(selectinload(sampled.locations))\
+			.limit(n * 4)\
+			.all()
+		if len(pdf_files) >= n or percent >= 100.0:
+			break
+		percent = min(100.0, percent * 2)
+	_sample_percent = percent
+	# SYSTEM samples whole pages, so shuffle before trimming to n
+	random.shuffle(pdf_files)
+	return pdf_files[:n]
 
 def save_file_collection(session, files, name=None, description=None, role='test'):
 	"""
@@ -67,102 +111,204 @@ def save_file_collection(session, files, name=None, description=None, role='test
 	collection = FileCollection(name=name, description=description or "Random PDF files for extraction performance test")
 	session.add(collection)
 	session.flush()  # get collection.id
-	for f in files:
-		session.add(FileCollectionMember(collection_id=collection.id, file_id=f.id, role=role))
+	# one executemany (psycopg pipelines it) instead of a unit-of-work INSERT per member
+	members = [{"collection_id": collection.id, "file_id": f.id, "role": role} for f in files]
+	if members:
+		session.execute(insert(FileCollectionMember), members)
 	session.commit()
 	return collection
 
-def get_local_filepaths(files: list[File], server_mount=None):
+def iter_local_filepaths(files, server_mount=None):
 	"""
-	Get local file paths for a list of File objects using their first location.
+	Lazily resolve local file paths for File objects using their first existing location.
+
+	Paths are checked one file at a time as the caller consumes them, so the
+	extraction benchmark can start on the first PDF while later locations are
+	still being stat'ed on the (possibly slow) server mount.
 
 	Args:
-		files (list[File]): List of File ORM objects.
+		files (Iterable[File]): File ORM objects, with File.locations eager-loaded.
 		server_mount (str, optional): Base path to prepend for local file resolution.
 
 	Returns:
-		list[str]: List of resolved file paths as strings.
+		Iterator[str]: Resolved file paths as strings.
 	"""
-	paths = []
 	if not server_mount:
 		raise ValueError("server_mount must be provided to resolve local file paths")
-	for f in files:
-		if f.locations:
-			for loc in f.locations:
+
+	files = list(files)
+	# candidate paths per directory (no I/O); a directory holding several candidates is
+	# listed once with scandir instead of stat'ing each file, each stat being an RPC on SMB/NFS
+	per_dir = Counter(
+		loc.local_filepath(server_mount).parent
+		for f in files for loc in (f.locations or ()) if loc.local_filepath(server_mount)
+	)
+	listings = {}
+
+	def is_file(p):
+		if per_dir[p.parent] < 2:
+			return os.path.isfile(p)
+		if p.parent not in listings:
+			try:
+				with os.scandir(p.parent) as entries:
+					listings[p.parent] = {e.name for e in entries if e.is_file()}
+			except FileNotFoundError:
+				listings[p.parent] = set()
+			except OSError:
+				listings[p.parent] = None  # unreadable listing; stat files individually
+		names = listings[p.parent]
+		if names is None:
+			return os.path.isfile(p)
+		# a miss may only be a case difference on a case-insensitive share, so confirm with stat
+		return p.name in names or (bool(names) and os.path.isfile(p))
+
+	def resolve():
+		for f in files:
+			for loc in f.locations or ():
 				p = loc.local_filepath(server_mount)
-				if os.path.exists(p) and os.path.isfile(p):
-					paths.append(str(p))
+				if p and is_file(p):
+					yield str(p)
 					break
-	return paths
+	return resolve()
+
+def get_local_filepaths(files: list[File], server_mount=None):
+	"""
+	Get local file paths for a list of File objects using their first location.
+
+	Expects File.locations to be eager-loaded (selectinload) by the caller's
+	query; otherwise each file triggers its own lazy load here.
+
+	Args:
+		files (list[File]): List of File ORM objects.
+		server_mount (str, optional): Base path to prepend for local file resolution.
 
-def compare_extractors(pdf_files, csv_path=None):
+	Returns:
+		list[str]: List of resolved file paths as strings.
+	"""
+	return list(iter_local_filepaths(files, server_mount=server_mount))
+
+# Extractors built once per process (the parent, or each pool worker) and reused for every file
+_extractors = None
+
+def _init_extractors():
+	"""Build this process's extractors; also the pool initializer, so workers do it before taking files."""
+	global _extractors
+	_extractors = (PDFTextExtractor(), PDFTextExtractor2())
+
+def _benchmark_pdf(pdf):
+	"""
+	Time both extractors on one PDF, back to back in the same process.
+
+	Args:
+		pdf (str): Path to the PDF file.
+
+	Returns:
+		dict: Timing, output length, and error for each extractor, plus size and page count.
+	"""
+	if _extractors is None:
+		_init_extractors()
+	extractor1, extractor2 = _extractors
+	# Get file size (one stat, kept even if the PDF won't open) and page count
+	# (a metadata-only open; no PDFFile validation, which the extractors repeat)
+	try:
+		size_mb = os.stat(pdf).st_size / (1024 * 1024)
+	except OSError:
+		size_mb = None
+	try:
+		with fitz.open(pdf) as doc:
+			page_count = doc.page_count
+	except Exception:
+		page_count = None
+	# PDFTextExtractor
+	t0 = time.time()
+	try:
+		text1 = extractor1(pdf)
+		err1 = None
+	except Exception as e:
+		text1 = ''
+		err1 = str(e)
+	t1 = time.time()
+	# PDFTextExtractor2
+	t2 = time.time()
+	try:
+		text2 = extractor2(pdf)
+		err2 = None
+	except Exception as e:
+		text2 = ''
+		err2 = str(e)
+	t3 = time.time()
+	return {
+		'file': pdf,
+		'mb_size': size_mb,
+		'page_count': page_count,
+		'extractor1_time': t1-t0,
+		'extractor2_time': t3-t2,
+		'extractor1_len': len(text1),
+		'extractor2_len': len(text2),
+		'extractor1_err': err1,
+		'extractor2_err': err2
+	}
+
+# Column order of the results CSV
+CSV_FIELDS = [
+	'file', 'mb_size', 'page_count',
+	'extractor1_time', 'extractor2_time',
+	'extractor1_len', 'extractor2_len',
+	'extractor1_err', 'extractor2_err'
+]
+
+def compare_extractors(pdf_files, csv_path=None, max_workers=1, verbose=False):
 	"""
 	Compare the performance and output of PDFTextExtractor and PDFTextExtractor2.
 
+	With max_workers > 1 files are benchmarked in parallel worker processes, which
+	shortens the run but lets workers compete for CPU, so per-file times read
+	higher than in a serial run. Both extractors still run back to back on each
+	file in the same worker, so their times stay comparable to each other.
+
+	Each result is written to the CSV as soon as it arrives, so a crashed or
+	interrupted run keeps every file finished so far.
+
 	Args:
-		pdf_files (list[str]): List of file paths to PDF files.
+		pdf_files (Iterable[str]): File paths to PDF files; may be a lazy iterator.
 		csv_path (str, optional): Path to save CSV results.
+		max_workers (int): Number of worker processes; 1 runs serially in this process.
+		verbose (bool): Print per-file timings as they arrive (a progress bar is shown either way).
 
 	Returns:
 		list[dict]: List of result dicts with timing, output length, and errors for each extractor.
 	"""
-	extractor1 = PDFTextExtractor()
-	extractor2 = PDFTextExtractor2()
+	def report(r):
+		results.append(r)
+		if writer:
+			writer.writerow(r)
+			csv_file.flush()
+		if verbose:
+			tqdm.write(f"\nTesting: {r['file']}")
+			tqdm.write(f"  PDFTextExtractor:   {r['extractor1_time']:.2f}s, length={r['extractor1_len']}, error={r['extractor1_err']}")
+			tqdm.write(f"  PDFTextExtractor2:  {r['extractor2_time']:.2f}s, length={r['extractor2_len']}, error={r['extractor2_err']}")
+
 	results = []
-	for pdf in pdf_files:
-		print(f"\nTesting: {pdf}")
-		# Get file size and page count
-		try:
-			pdf_file = PDFFile(pdf)
-			size_mb = pdf_file.size / (1024 * 1024)
-			page_count = pdf_file.page_count
-		except Exception as e:
-			size_mb = None
-			page_count = None
-		# PDFTextExtractor
-		t0 = time.time()
-		try:
-			text1 = extractor1(pdf)
-			err1 = None
-		except Exception as e:
-			text1 = ''
-			err1 = str(e)
-		t1 = time.time()
-		# PDFTextExtractor2
-		t2 = time.time()
-		try:
-			text2 = extractor2(pdf)
-			err2 = None
-		except Exception as e:
-			text2 = ''
-			err2 = str(e)
-		t3 = time.time()
-		results.append({
-			'file': pdf,
-			'mb_size': size_mb,
-			'page_count': page_count,
-			'extractor1_time': t1-t0,
-			'extractor2_time': t3-t2,
-			'extractor1_len': len(text1),
-			'extractor2_len': len(text2),
-			'extractor1_err': err1,
-			'extractor2_err': err2
-		})
-		print(f"  PDFTextExtractor:   {t1-t0:.2f}s, length={len(text1)}, error={err1}")
-		print(f"  PDFTextExtractor2:  {t3-t2:.2f}s, length={len(text2)}, error={err2}")
-
-	# Write CSV if requested
-	if csv_path:
-		with open(csv_path, "w", newline='', encoding="utf-8") as f:
-			writer = csv.DictWriter(f, fieldnames=[
-				'file', 'mb_size', 'page_count',
-				'extractor1_time', 'extractor2_time',
-				'extractor1_len', 'extractor2_len',
-				'extractor1_err', 'extractor2_err'
-			])
+	with contextlib.ExitStack() as stack:
+		writer = csv_file = None
+		if csv_path:
+			csv_file = stack.enter_context(open(csv_path, "w", newline='', encoding="utf-8"))
+			writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
 			writer.writeheader()
-			for row in results:
-				writer.writerow(row)
+
+		if max_workers <= 1:
+			rows = map(_benchmark_pdf, pdf_files)
+		else:
+			executor = stack.enter_context(ProcessPoolExecutor(
+				max_workers=max_workers,
+				mp_context=mp.get_context('spawn'),
+				initializer=_init_extractors,
+			))
+			# map keeps input order, so the CSV lines up with pdf_files; chunksize stays 1
+			# because a PDF takes seconds, far more than the IPC it would save
+			rows = executor.map(_benchmark_pdf, pdf_files)
+		for r in tqdm(rows, desc="Benchmarking PDFs", unit="file"):
+			report(r)
 	return results
 
 def print_summary_stats(results):
@@ -210,8 +356,13 @@ if __name__ == "__main__":
 	collection = session.query(FileCollection).filter_by(name=collection_name).first()
 	if collection:
 		print(f"Using existing collection: {collection.name} (id={collection.id})")
-		# Get files from collection
-		pdf_file_objs = [m.file for m in collection.members]
+		# Get files from collection: one query, locations loaded in IN (...) batches;
+		# fetched whole, since iter_local_filepaths groups every file's directory up front
+		members_stmt = select(File)\
+			.join(FileCollectionMember, FileCollectionMember.file_id == File.id)\
+			.where(FileCollectionMember.collection_id == collection.id)\
+			.options(selectinload(File.locations))
+		pdf_file_objs = session.execute(members_stmt).scalars().all()
 	else:
 		# Query for random PDF files
 		n = int(os.environ.get("PDF_PERF_TEST_N", 100))
@@ -224,15 +375,18 @@ if __name__ == "__main__":
 		print(f"Saved {len(pdf_file_objs)} files to collection: {collection.name} (id={collection.id})")
 
 	# Get local filepaths (assume server_mount is not needed or set via env)
+	# resolved lazily, so extraction overlaps the existence checks on the mount
 	server_mount = os.environ.get("FILE_SERVER_MOUNT")
-	pdf_paths = get_local_filepaths(pdf_file_objs, server_mount=server_mount)
-	if not pdf_paths:
-		print("No valid file paths found for selected PDFs.")
-		exit(1)
+	pdf_paths = iter_local_filepaths(pdf_file_objs, server_mount=server_mount)
 
 	# Save results to CSV in current directory
 	csv_path = "pdf_extraction_performance_results.csv"
-	results = compare_extractors(pdf_paths, csv_path=csv_path)
+	max_workers = int(os.environ.get("PDF_PERF_TEST_WORKERS", 1))
+	verbose = os.environ.get("PDF_PERF_TEST_VERBOSE", "").lower() in ("1", "true", "yes")
+	results = compare_extractors(pdf_paths, csv_path=csv_path, max_workers=max_workers, verbose=verbose)
+	if not results:
+		print("No valid file paths found for selected PDFs.")
+		exit(1)
 	print(f"\nResults saved to {csv_path}")
 
 	print("\nSummary:")
@@ -21,6 +21,7 @@ class FileTextExtractor(ABC):
     implement the __call__ method to handle specific file formats.
     """
     file_extensions: List[str] = None  # Class variable to define supported file extensions
+    requires_local_copy: bool = False  # True if the extractor cannot read straight off a server mount
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -64,6 +65,20 @@ class TextFileTextExtractor(FileTextExtractor):
     def __init__(self):
         super().__init__()
         self.encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
+        # built on first Markdown file and reused; see _markdown_to_html
+        self._markdown = None
+
+    def _markdown_to_html(self, content: str) -> str:
+        """
+        Render Markdown with one reused parser instead of markdown.markdown().
+
+        markdown.markdown() builds a new Markdown instance (extension loading,
+        pattern registries) on every call; reset() only clears per-document
+        state such as reference links, so the output is the same.
+        """
+        if self._markdown is None:
+            self._markdown = markdown.Markdown()
+        return self._markdown.reset().convert(content)
     
     def __call__(self, path: str) -> str:
         """
@@ -90,27 +105,54 @@ class TextFileTextExtractor(FileTextExtractor):
         # validate file path and type
         file_path = validate_file(path)
         logger.debug(f"Validated file path: {file_path}")
-        
+        return self.from_bytes(file_path.read_bytes(), file_path.name)
+
+    def from_bytes(self, data, filename: str) -> str:
+        """
+        Extract text content from the raw bytes of a plain text file.
+
+        Parameters
+        ----------
+        data : bytes-like
+            File contents (bytes, memoryview or a read-only mmap).
+        filename : str
+            Original filename; its extension selects XML/Markdown handling.
+
+        Returns
+        -------
+        str
+            Extracted text content.
+
+        Raises
+        ------
+        ValueError
+            If the data cannot be decoded with any of the supported encodings.
+        """
+        suffix = Path(filename).suffix.lower()
         # Try different encodings
         for encoding in self.encodings:
-            logger.debug(f"Trying encoding: {encoding} for file: {file_path}")
-            try:
-                with open(file_path, 'r', encoding=encoding) as file: #TODO:  errors='ignore'?
-                    if file_path.suffix.lower() == ".xml":
-                        logger.debug(f"Stripping XML content from file: {file_path}")
-                        return strip_html(file.read(), parser="xml")
-                    
-                    elif file_path.suffix.lower() == ".md":
-                        logger.debug(f"Converting Markdown to HTML for file: {file_path}")
-                        text = markdown.markdown(file.read())
-                        return strip_html(text, parser="html")
-
-                    return file.read()
+            logger.debug(f"Trying encoding: {encoding} for file: {filename}")
+            try: #TODO:  errors='ignore'?
+                content = str(data, encoding)
             except UnicodeDecodeError:
                 continue
-        
+            # match the newline translation of text-mode reads (skipped, along
+            # with its two full copies, for files with plain \n line endings)
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            if suffix == ".xml":
+                logger.debug(f"Stripping XML content from file: {filename}")
+                return strip_html(content, parser="xml")
+
+            elif suffix == ".md":
+                logger.debug(f"Converting Markdown to HTML for file: {filename}")
+                text = self._markdown_to_html(content)
+                return strip_html(text, parser="html")
+
+            return content
+
         # If we get here, none of the encodings worked
-        raise ValueError(f"Unable to read file with supported encodings: {path}")
+        raise ValueError(f"Unable to read file with supported encodings: {filename}")
 
 
 class TikaUnsupportedError(Exception):
@@ -127,9 +169,15 @@ class TikaNoContentError(Exception):
         super().__init__(f"{message}: {filepath}")
 
 
+# Bytes read per chunk when streaming a Tika response
+_TIKA_READ_CHUNK = 64 * 1024
+
 class TikaTextExtractor(FileTextExtractor):
     """
     Fallback extractor using a containerized Apache Tika (REST API).
+
+    Requests go through one long-lived httpx.Client, so the connection to the
+    Tika server is kept alive across files instead of reopened per request.
     """
     # Extensions are lowercase, no leading dot (as per spec)
     # catch‐all for most formats; register this last in your extractor list
@@ -147,57 +195,109 @@ class TikaTextExtractor(FileTextExtractor):
         self.tika_endpoint = f"{self.server_url}/tika"
         self.detect_endpoint = f"{self.server_url}/detect/stream"
         self.timeout = timeout
+        self._client = httpx.Client(timeout=self.timeout)
 
-        # sanity check server is up
-        r = httpx.get(self.tika_endpoint, headers={'Accept': 'text/plain'}, timeout=self.timeout)
-        r.raise_for_status()
+        # sanity check server is up; don't leave the pool open if it isn't
+        try:
+            r = self._client.get(self.tika_endpoint, headers={'Accept': 'text/plain'})
+            r.raise_for_status()
+        except Exception:
+            self._client.close()
+            raise
+
+    def close(self):
+        """Close the pooled HTTP connection(s) to the Tika server."""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        # the client is missing if __init__ failed before creating it (e.g. Tika unreachable)
+        client = getattr(self, '_client', None)
+        if client is not None:
+            client.close()
 
     def _detect_mime(self, path: Path) -> str:
         # filename hint improves detection
         with open(path, 'rb') as fh:
-            r = httpx.put(
+            r = self._client.put(
                 self.detect_endpoint,
                 content=fh,
-                headers={'Content-Disposition': f'attachment; filename=\"{path.name}\"'},
-                timeout=self.timeout
+                headers={'Content-Disposition': f'attachment; filename=\"{path.name}\"'}
             )
         r.raise_for_status()
         return (r.text or '').strip()
 
     def __call__(self, path: str) -> str:
         p = validate_file(path)
-        # Preflight: detect MIME
-        mime = self._detect_mime(p)
-        logger.debug(f"Tika detected MIME for {p}: {mime or 'UNKNOWN'}")
-
-        # Fast-fail on clearly unknown/opaque types
-        if not mime or mime == 'application/octet-stream':
-            raise TikaUnsupportedError(f"Tika can’t determine a usable MIME type for {p}")
-
-        logger.info(f"Extracting text from {p} with Tika (MIME={mime})")
-        # Extract text
-        with open(p, 'rb') as fh:
-            resp = httpx.put(
-                self.tika_endpoint,
-                content=fh,
-                headers={'Accept': 'text/plain'},
-                timeout=self.timeout
-            )
-
-        # Explicit handling of common outcomes
-        if resp.status_code == 204:
-            raise TikaNoContentError(f"Tika returned 204 No Content for {p}")
-        if resp.status_code == 422:
-            raise TikaUnsupportedError(f"Tika returned 422 (unsupported/encrypted) for {p}: {resp.text}")
-
-        resp.raise_for_status()
-
-        text = resp.text or ""
+        if p.suffix.lower().lstrip('.') in self.file_extensions:
+            # Registered extension: skip the preflight upload; the filename hint
+            # below lets Tika's own detection on /tika pick the parser
+            mime = None
+        else:
+            # Preflight: detect MIME
+            mime = self._detect_mime(p)
+            logger.debug(f"Tika detected MIME for {p}: {mime or 'UNKNOWN'}")
+
+            # Fast-fail on clearly unknown/opaque types
+            if not mime or mime == 'application/octet-stream':
+                raise TikaUnsupportedError(f"Tika can’t determine a usable MIME type for {p}")
+
+        logger.info(f"Extracting text from {p} with Tika (MIME={mime or 'from filename'})")
+        # Extract text; httpx uploads the open file in chunks, and the response is
+        # streamed and decoded chunk by chunk so the raw body is never held beside the text
+        with open(p, 'rb') as fh, self._client.stream(
+            "PUT",
+            self.tika_endpoint,
+            content=fh,
+            headers={
+                'Accept': 'text/plain',
+                'Content-Disposition': f'attachment; filename=\"{p.name}\"',
+            }
+        ) as resp:
+            # Explicit handling of common outcomes
+            if resp.status_code == 204:
+                raise TikaNoContentError(f"Tika returned 204 No Content for {p}")
+            if resp.is_error:
+                resp.read()  # error bodies are small; load them for the message
+            if resp.status_code == 422:
+                raise TikaUnsupportedError(f"Tika returned 422 (unsupported/encrypted) for {p}: {resp.text}")
+
+            resp.raise_for_status()
+
+            text = "".join(resp.iter_text(chunk_size=_TIKA_READ_CHUNK))
         if not text.strip():
-            logger.warning(f"Tika returned 200 but empty body for {p} (MIME={mime})")
+            logger.warning(f"Tika returned 200 but empty body for {p} (MIME={mime or 'from filename'})")
         return text
     
-def get_extractor_for_file(file_path: str, extractors: list) -> FileTextExtractor:
+def extension_dispatch(extractors: list) -> dict:
+    """
+    Map each extension to the first extractor in extractors that handles it.
+
+    Build this once, where the extractor list is built, and pass it to
+    get_extractor_for_file in place of the list.
+
+    Parameters
+    ----------
+    extractors : list
+        List of extractor instances, in priority order.
+
+    Returns
+    -------
+    dict
+        Extension (lowercase, no dot) to extractor instance.
+    """
+    dispatch = {}
+    for extractor in extractors:
+        for ext in extractor.file_extensions:
+            dispatch.setdefault(ext, extractor)
+    return dispatch
+
+def get_extractor_for_file(file_path: str, extractors: list | dict) -> FileTextExtractor:
     """
     Determine the appropriate extractor for a given file based on its extension.
 
@@ -205,8 +305,9 @@ def get_extractor_for_file(file_path: str, extractors: list) -> FileTextExtracto
     ----------
     file_path : str
         Path to the file to be processed.
-    extractors : list
-        List of extractor instances.
+    extractors : list or dict
+        List of extractor instances, or a table from extension_dispatch(),
+        which turns the lookup into a single dict access.
 
     Returns
     -------
@@ -220,10 +321,13 @@ def get_extractor_for_file(file_path: str, extractors: list) -> FileTextExtracto
     """
     logger.debug(f"Finding extractor for file: {file_path}")
     file_extension = Path(file_path).suffix.lower().lstrip(".")
-    for extractor in extractors:
-        if file_extension in extractor.file_extensions:
-            logger.debug(f"Selected extractor {extractor.__class__.__name__} for file: {file_path}")
-            return extractor
+    if isinstance(extractors, dict):
+        extractor = extractors.get(file_extension)
+    else:
+        extractor = next((e for e in extractors if file_extension in e.file_extensions), None)
+    if extractor is not None:
+        logger.debug(f"Selected extractor {extractor.__class__.__name__} for file: {file_path}")
+        return extractor
     logger.error(f"No extractor found for file extension: {file_extension}")
     return None
 
@@ -243,49 +347,56 @@ class DateExtractor:
       - Final year window filter (default 1960–2035) reduces OCR noise further.
     """
 
+    # Patterns are compiled once, when the class is defined, and shared by all instances.
+    # The leading lookaheads don't change what matches; they let the scanner reject
+    # most positions on one character instead of trying every alternative there.
+
+    # YYYY[-/.]MM[-/.]DD  (ISO-ish)
+    rx_iso = re.compile(
+        r'(?=\d)\b((?:19|20)\d{2})[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12]\d|3[01])\b'
+    )
+
+    # MM[-/.]DD[-/.]YYYY (US MDY, 4-digit year)
+    rx_mdy4 = re.compile(
+        r'(?=\d)\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.]((?:19|20)\d{2})\b'
+    )
+
+    # NEW: MM[-/.]DD[-/.]YY (US MDY, 2-digit year)
+    # Examples (match): "6/1/24", "06-01-00", "12.31.69"
+    # Non-matches: "1/8" (no 2-digit year), "13/01/24" (invalid month; date() filter will reject anyway)
+    rx_mdy2 = re.compile(
+        r'(?=\d)\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.](\d{2})\b'
+    )
+
+    # (Optional) DD[-/.]MM[-/.]YYYY (DMY)
+    rx_dmy4 = re.compile(
+        r'(?=\d)\b(0?[1-9]|[12]\d|3[01])[-/.](0?[1-9]|1[0-2])[-/.]((?:19|20)\d{2})\b'
+    )
+
+    # MonthName DD[, ]YYYY
+    rx_mon = re.compile(
+        r'(?ix)\b(?=[adfjmnos])'
+        r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
+        r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|'
+        r'nov(?:ember)?|dec(?:ember)?)'
+        r'\s+([0-3]?\d)(?:,)?\s+((?:19|20)\d{2})\b'
+    )
+
+    # every pattern needs digits; texts without any skip the scans entirely
+    rx_digit = re.compile(r'\d')
+
+    month_to_number_map = {
+        m: i for i, m in enumerate(
+            ['jan','feb','mar','apr','may','jun','jul','aug','sep','oct','nov','dec'], start=1
+        )
+    }
+
     def __init__(self, year_min=1960, year_max=2035, enable_dmy=False, yy_pivot=60):
         self.year_min = year_min
         self.year_max = year_max
         self.enable_dmy = enable_dmy
         self.yy_pivot = yy_pivot  # e.g., 60 -> 60–99 => 1900s; 00–59 => 2000s
 
-        # YYYY[-/.]MM[-/.]DD  (ISO-ish)
-        self.rx_iso = re.compile(
-            r'\b((?:19|20)\d{2})[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12]\d|3[01])\b'
-        )
-
-        # MM[-/.]DD[-/.]YYYY (US MDY, 4-digit year)
-        self.rx_mdy4 = re.compile(
-            r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.]((?:19|20)\d{2})\b'
-        )
-
-        # NEW: MM[-/.]DD[-/.]YY (US MDY, 2-digit year)
-        # Examples (match): "6/1/24", "06-01-00", "12.31.69"
-        # Non-matches: "1/8" (no 2-digit year), "13/01/24" (invalid month; date() filter will reject anyway)
-        self.rx_mdy2 = re.compile(
-            r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.](\d{2})\b'
-        )
-
-        # (Optional) DD[-/.]MM[-/.]YYYY (DMY)
-        self.rx_dmy4 = re.compile(
-            r'\b(0?[1-9]|[12]\d|3[01])[-/.](0?[1-9]|1[0-2])[-/.]((?:19|20)\d{2})\b'
-        )
-
-        # MonthName DD[, ]YYYY
-        self.rx_mon = re.compile(
-            r'(?ix)\b'
-            r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
-            r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|'
-            r'nov(?:ember)?|dec(?:ember)?)'
-            r'\s+([0-3]?\d)(?:,)?\s+((?:19|20)\d{2})\b'
-        )
-
-        self.month_to_number_map = {
-            m: i for i, m in enumerate(
-                ['jan','feb','mar','apr','may','jun','jul','aug','sep','oct','nov','dec'], start=1
-            )
-        }
-
     def _normalize_yy(self, yy_str: str) -> int:
         """
         Normalize a 2-digit year to 4 digits using a pivot.
@@ -305,7 +416,7 @@ class DateExtractor:
             return None
 
     def __call__(self, txt: str):
-        if not txt:
+        if not txt or not self.rx_digit.search(txt):
             return []
 
         candidates = []
@@ -4,11 +4,13 @@
 import logging
 import pythoncom
 import subprocess
+import sys
 import tempfile
 import unicodedata
 import win32com.client
 from bs4 import BeautifulSoup
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,27 @@ try:
 except ImportError:
     _HAS_UNIDECODE = False
 
+try:
+    from selectolax.lexbor import LexborHTMLParser  # C (lexbor) HTML parser, much faster than bs4 for stripping
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
 # common replacements (curly quotes, dashes, ligatures, etc.)
+_CHAR_REPLACEMENTS = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u00a0": " ",  # non-breaking space
+    "\u2026": "...",  # ellipsis
+    "\ufb01": "fi",  # ﬁ ligature
+    "\ufb02": "fl",  # ﬂ ligature
+    "\x00": "",  # remove NUL bytes
+})
+
 def common_char_replacements(text: str) -> str:
     """
     Replace common typographic Unicode characters with simpler ASCII equivalents.
@@ -34,23 +56,13 @@ def common_char_replacements(text: str) -> str:
     str
         Text with characters like “ ” – — ﬁ ﬂ replaced by their ASCII counterparts.
     """
+    return text.translate(_CHAR_REPLACEMENTS)
 
-    replacements_dict = {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u2013": "-",  # en dash
-        "\u2014": "-",  # em dash
-        "\u00a0": " ",  # non-breaking space
-        "\u2026": "...",  # ellipsis
-        "\ufb01": "fi",  # ﬁ ligature
-        "\ufb02": "fl",  # ﬂ ligature
-        "\x00": "",  # remove NUL bytes
-    }
-    for src, dst in replacements_dict.items():
-        text = text.replace(src, dst)   
-    return text
+@cache
+def _combining_marks_table() -> dict:
+    """translate() table deleting every Unicode mark (category M); built once on first use."""
+    return {cp: None for cp in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(cp)).startswith("M")}
 
 def strip_diacritics(text: str) -> str:
     """
@@ -68,19 +80,42 @@ def strip_diacritics(text: str) -> str:
         Text with diacritics stripped; uses unidecode if available, else drops
         non-ASCII characters.
     """
+    if text.isascii():
+        return text
     # Normalize to NFD to separate base chars from diacritics
     nfkd = unicodedata.normalize("NFD", text)
+    if not _HAS_UNIDECODE:
+        # combining marks are non-ASCII, so the ASCII filter drops them too
+        return nfkd.encode("ascii", errors="ignore").decode("ascii")
     # Remove combining marks (diacritics)
-    no_diacritics = "".join(c for c in nfkd if not unicodedata.category(c).startswith("M"))
+    no_diacritics = nfkd.translate(_combining_marks_table())
     # Recompose
     cleaned = unicodedata.normalize("NFC", no_diacritics)
-    if _HAS_UNIDECODE:
-        # Further transliterate any remaining exotic characters to ASCII
-        cleaned = unidecode(cleaned)
-    else:
-        # Drop any remaining non-ASCII aggressively
-        cleaned = cleaned.encode("ascii", errors="ignore").decode("ascii")
-    return cleaned
+    # Further transliterate any remaining exotic characters to ASCII
+    return unidecode(cleaned)
+
+def clean_text(text: str) -> str:
+    """
+    Clean extracted text for embedding.
+
+    Equivalent to common_char_replacements, strip_diacritics,
+    normalize_unicode and normalize_whitespace applied in turn, but the
+    character replacements are a single translate() pass and the Unicode
+    steps are skipped entirely for ASCII text (strip_diacritics already
+    yields ASCII, so the NFC pass is a no-op).
+
+    Parameters
+    ----------
+    text : str
+        Raw extracted text.
+
+    Returns
+    -------
+    str
+        ASCII text with whitespace runs collapsed to single spaces.
+    """
+    text = strip_diacritics(common_char_replacements(text))
+    return " ".join(text.split())
 
 def validate_file(path: str) -> Path:
     """
@@ -88,7 +123,7 @@ def validate_file(path: str) -> Path:
 
     Parameters
     ----------
-    path : str
+    path : str | Path
         Filesystem path to validate.
 
     Returns
@@ -101,8 +136,9 @@ def validate_file(path: str) -> Path:
     FileNotFoundError
         If the path does not exist or is not a file.
     """
-    p = Path(path)
-    if not p.exists() or not p.is_file():
+    p = path if isinstance(path, Path) else Path(path)
+    # is_file() is False for missing paths too, so one stat() covers both checks
+    if not p.is_file():
         raise FileNotFoundError(path)
     return p
 
@@ -147,7 +183,9 @@ def strip_html(html: str, parser: str = "lxml", remove_tags=None) -> str:
     html : str
         Raw HTML content.
     parser : str, optional
-        Parser to pass to BeautifulSoup, by default "lxml".
+        Parser to pass to BeautifulSoup, by default "lxml". When selectolax is
+        installed, HTML is parsed with lexbor instead and this only matters for
+        "xml", which always goes through BeautifulSoup.
     remove_tags : list[str] or None
         Tags to remove entirely (e.g., ["script", "style"]), by default None.
 
@@ -158,6 +196,11 @@ def strip_html(html: str, parser: str = "lxml", remove_tags=None) -> str:
     """
     if remove_tags is None:
         remove_tags = ["script", "style", "noscript"]
+    if _HAS_SELECTOLAX and parser != "xml":
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(remove_tags)
+        root = tree.root
+        return normalize_whitespace(root.text(separator=" ", strip=True) if root is not None else "")
     soup = BeautifulSoup(html, parser)
     for t in soup(remove_tags):
         t.decompose()
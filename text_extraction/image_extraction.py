@@ -1,7 +1,11 @@
 # text_extraction/image_extractor.py
+import io
 import logging
+import os
 import pytesseract
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from pathlib import Path
 from PIL import Image, ImageOps, ImageSequence
@@ -15,12 +19,24 @@ try:
 except ImportError:
     _HAS_CV2 = False
 
+try:
+    # optional: drives libtesseract in-process instead of forking the CLI per call
+    from tesserocr import PyTessBaseAPI, PSM
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
+
 from .basic_extraction import FileTextExtractor
 
 
 class ImageTextExtractor(FileTextExtractor):
     """
-    OCR text from image files using Tesseract (via pytesseract).
+    OCR text from image files using Tesseract.
+
+    Uses a persistent tesserocr API (one per thread, so one per worker process
+    in the pipeline) when tesserocr is installed, which loads the language
+    model once instead of starting the tesseract CLI for every call.
+    Falls back to pytesseract otherwise.
 
     Supports automatic orientation correction via Tesseract OSD,
     plus optional light pre-processing for better OCR on scans/phone pics.
@@ -37,7 +53,9 @@ class ImageTextExtractor(FileTextExtractor):
                  oem: int = 3,
                  preprocess: bool = True,
                  max_side: int = 3000,
-                 default_image_dpi: int = 300):
+                 default_image_dpi: int = 300,
+                 use_tesserocr: bool = True,
+                 page_workers: int | None = None):
         r"""
         Parameters
         ----------
@@ -55,6 +73,13 @@ class ImageTextExtractor(FileTextExtractor):
             Resize largest image side to this (keeps memory reasonable).
         default_image_dpi : int
             DPI to use for images without embedded DPI info.
+        use_tesserocr : bool
+            Use tesserocr's in-process API when it is installed.
+        page_workers : int | None
+            Threads used to OCR the frames of a multi-page image in parallel
+            (tesserocr releases the GIL while recognizing). If None, the
+            OCR_PAGE_WORKERS env var is used, default 1 (serial), since the
+            pipeline already runs one extractor per core. Ignored without tesserocr.
         """
         super().__init__()
         if tesseract_cmd:
@@ -65,6 +90,48 @@ class ImageTextExtractor(FileTextExtractor):
         self.preprocess = preprocess
         self.max_side = max_side
         self.default_image_dpi = default_image_dpi
+        self.use_tesserocr = use_tesserocr and _HAS_TESSEROCR
+        self.page_workers = max(page_workers or int(os.environ.get("OCR_PAGE_WORKERS", 1)), 1)
+        if self.use_tesserocr and self.page_workers > 1:
+            # one OpenMP thread per API, or every page thread fans out across all cores again
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        # kept for the extractor's lifetime so each page thread reuses its tesserocr APIs
+        self._page_pool = None
+        # tesserocr APIs are not thread-safe, so each thread keeps its own;
+        # every API created is also listed here so close() can release them all
+        self._tess_state = threading.local()
+        self._tess_apis = []
+        self._tess_lock = threading.Lock()
+
+    def close(self):
+        """
+        Release the tesserocr APIs (and their loaded language models) of every thread.
+
+        Call only when no OCR is in flight; a later call simply creates fresh APIs.
+        Safe to call when no API was ever created, or when __init__ failed part way.
+        """
+        lock = getattr(self, "_tess_lock", None)
+        if lock is None:
+            return
+        with lock:
+            apis, self._tess_apis = self._tess_apis, []
+            self._tess_state = threading.local()
+            pool, self._page_pool = self._page_pool, None
+        if pool is not None:
+            pool.shutdown()
+        for api in apis:
+            api.End()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        # attributes are missing if __init__ failed part way
+        if getattr(self, "_tess_apis", None) or getattr(self, "_page_pool", None):
+            self.close()
 
     def __call__(self, path: str) -> str:
         logger.info(f"Extracting text from image: {path}")
@@ -72,32 +139,93 @@ class ImageTextExtractor(FileTextExtractor):
         if not p.exists():
             raise FileNotFoundError(path)
 
-        images = self._load_images(p)
+        return self._ocr_frames(self._load_images(p))
+
+    def from_bytes(self, data, filename: str) -> str:
+        """
+        OCR an image from its raw bytes.
+
+        Parameters
+        ----------
+        data : bytes-like or file-like
+            Image contents (bytes, or a seekable object such as a read-only mmap).
+        filename : str
+            Original filename (used for logging only).
+
+        Returns
+        -------
+        str
+            OCR text of all frames.
+        """
+        logger.info(f"Extracting text from image bytes: {filename}")
+        src = data if hasattr(data, "read") else io.BytesIO(data)
+        return self._ocr_frames(self._load_images(src))
+
+    def _ocr_frames(self, images: List[Image.Image]) -> str:
+        """Orient, preprocess and OCR each frame; join the results."""
         logger.debug(f"Loaded {len(images)} image frames for OCR")
-        texts = []
-        for img in images:
-            # detect and correct orientation
-            img = self._ensure_longside_bottom(img)
-            img = self._inject_dpi(img, self.default_image_dpi)
-            img = self.detect_and_correct_orientation(img)
-            if self.preprocess:
-                img = self._preprocess(img)
-                logger.debug("Applied preprocessing to image")
-
-            cfg = f"--psm {self.psm} --oem {self.oem}"
-            txt = pytesseract.image_to_string(
-                image=img,
-                lang=self.lang,
-                config=config_str(cfg)
+        if len(images) > 1 and self.use_tesserocr and self.page_workers > 1:
+            if self._page_pool is None:
+                self._page_pool = ThreadPoolExecutor(
+                    max_workers=self.page_workers, thread_name_prefix="ocr-page"
                 )
-            logger.debug(f"Extracted text length: {len(txt)} characters")
-            texts.append(txt)
+            # map keeps frame order
+            texts = self._page_pool.map(self._ocr_frame, images)
+        else:
+            texts = map(self._ocr_frame, images)
 
         return "\n".join(texts)
 
+    def _ocr_frame(self, img: Image.Image) -> str:
+        """Orient, preprocess and OCR a single frame."""
+        # detect and correct orientation
+        img = self._ensure_longside_bottom(img)
+        img = self._inject_dpi(img, self.default_image_dpi)
+        img = self.detect_and_correct_orientation(img)
+        if self.preprocess:
+            img = self._preprocess(img)
+            logger.debug("Applied preprocessing to image")
+
+        txt = self._ocr(img)
+        logger.debug(f"Extracted text length: {len(txt)} characters")
+        return txt
+
     # ---------- helpers ----------
-    def _load_images(self, path: Path) -> List[Image.Image]:
-        """Handle multi-page TIFFs and GIFs gracefully."""
+    def _tess_api(self, kind: str) -> "PyTessBaseAPI":
+        """
+        Return this thread's tesserocr API for 'ocr' or 'osd', creating it on
+        first use so the model load is paid once per thread.
+        """
+        api = getattr(self._tess_state, kind, None)
+        if api is None:
+            # PSM/OEM are plain int constants in tesserocr (the classes can't be
+            # instantiated), so the configured ints are passed straight through
+            if kind == "osd":
+                api = PyTessBaseAPI(lang="osd", psm=PSM.OSD_ONLY)
+            else:
+                api = PyTessBaseAPI(lang=self.lang, psm=self.psm, oem=self.oem)
+            with self._tess_lock:
+                self._tess_apis.append(api)
+                state = self._tess_state
+            setattr(state, kind, api)
+        return api
+
+    def _ocr(self, pil_img: Image.Image) -> str:
+        """OCR one prepared image with tesserocr if available, else pytesseract."""
+        if self.use_tesserocr:
+            api = self._tess_api("ocr")
+            api.SetImage(pil_img)
+            api.SetSourceResolution(int(pil_img.info.get("dpi", (self.default_image_dpi,))[0]))
+            return api.GetUTF8Text()
+        cfg = f"--psm {self.psm} --oem {self.oem}"
+        return pytesseract.image_to_string(
+            image=pil_img,
+            lang=self.lang,
+            config=config_str(cfg)
+            )
+
+    def _load_images(self, path) -> List[Image.Image]:
+        """Handle multi-page TIFFs and GIFs gracefully. Accepts a path or a seekable file object."""
         logger.debug(f"Loading images from path: {path}")
         imgs = []
         with Image.open(path) as im:
@@ -158,6 +286,17 @@ class ImageTextExtractor(FileTextExtractor):
         """
         Use Tesseract OSD to detect rotation and counter-rotate image upright.
         """
+        if self.use_tesserocr:
+            api = self._tess_api("osd")
+            api.SetImage(pil_img)
+            result = api.DetectOrientationScript()
+            if not result:
+                logger.error("Tesseract OSD failed")
+                return pil_img
+            # orient_deg is the page's detected clockwise rotation; the CLI's
+            # "Rotate:" line reports (360 - orient_deg) % 360 from the same value
+            return self._rotate_upright(pil_img, (360 - result["orient_deg"]) % 360)
+
         try:
             osd = pytesseract.image_to_osd(pil_img)
         except pytesseract.TesseractError as e:
@@ -167,10 +306,17 @@ class ImageTextExtractor(FileTextExtractor):
         logger.debug(f"Tesseract OSD output: {osd.strip()}")
         rot_match = re.search(r"Rotate: (\d+)", osd)
         if rot_match:
-            angle = int(rot_match.group(1))
-            if angle != 0:
-                pil_img = pil_img.rotate(360 - angle, expand=True)
-                logger.info(f"Rotated image by {360-angle} degrees to correct orientation")
+            pil_img = self._rotate_upright(pil_img, int(rot_match.group(1)))
+        return pil_img
+
+    def _rotate_upright(self, pil_img: Image.Image, angle: int) -> Image.Image:
+        """
+        Apply Tesseract's "Rotate:" value (degrees clockwise to make the page
+        upright); PIL rotates counter-clockwise, hence 360 - angle.
+        """
+        if angle != 0:
+            pil_img = pil_img.rotate(360 - angle, expand=True)
+            logger.info(f"Rotated image by {360-angle} degrees to correct orientation")
         return pil_img
     
     def _inject_dpi(self, pil_img: Image.Image, dpi: int) -> Image.Image:
@@ -1,10 +1,16 @@
 # text_extraction/msft_extractor.py
 
+import atexit
 import io
+import itertools
 import logging
 import mammoth
+import pythoncom
+import pywintypes
 import tempfile
+import threading
 import pandas as pd
+import win32com.client
 from pathlib import Path
 from typing import List
 from docx import Document
@@ -15,15 +21,74 @@ from .extraction_utils import validate_file, run_pandoc, com_app
 
 logger = logging.getLogger(__name__)
 
+# HRESULTs meaning the COM server behind a proxy is gone (RPC_S_SERVER_UNAVAILABLE,
+# RPC_E_DISCONNECTED, RPC_S_CALL_FAILED, CO_E_OBJNOTCONNECTED)
+_COM_SERVER_GONE = {-2147023174, -2147417848, -2147023170, -2147220995}
+
+# Word COM servers started by any extractor on any thread, as marshaled interface
+# streams keyed by a token, so the exit hook (on the main thread) can quit the
+# servers of threads that never called close(). Holding streams rather than
+# extractors keeps the registry from extending extractor lifetimes.
+_word_servers = {}
+_word_servers_lock = threading.Lock()
+_word_server_tokens = itertools.count()
+
+def _register_word_server(word) -> int:
+    """Record a Word server for the exit hook; returns its registry token."""
+    stream = pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, word._oleobj_)
+    token = next(_word_server_tokens)
+    with _word_servers_lock:
+        _word_servers[token] = stream
+    return token
+
+def _unregister_word_server(token) -> None:
+    """Forget a Word server its own thread has quit (or found dead)."""
+    with _word_servers_lock:
+        stream = _word_servers.pop(token, None)
+    if stream is not None:
+        try:
+            # unmarshal once to release the stream's reference; the proxy is dropped at once
+            pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+        except pywintypes.com_error:
+            pass
+
+@atexit.register
+def _quit_leftover_word_servers():
+    """Quit Word servers still registered at interpreter exit, whichever thread started them."""
+    with _word_servers_lock:
+        streams = list(_word_servers.values())
+        _word_servers.clear()
+    if not streams:
+        return
+    pythoncom.CoInitialize()
+    try:
+        for stream in streams:
+            try:
+                word = win32com.client.Dispatch(
+                    pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch))
+                word.Quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit Word COM server at exit: {e}")
+    finally:
+        pythoncom.CoUninitialize()
+
 class WordFileTextExtractor(FileTextExtractor):
     """
     Windows-friendly text extractor for Word formats.
     - DOCX/DOCM: mammoth -> markdown (fallback python-docx)
     - DOC/RTF:   convert via Word COM to TXT (fast, reliable) then read
                  (fallback to pandoc or striprtf if Word isn't installed)
+
+    The Word COM server is started lazily on first use and reused for every
+    subsequent legacy document (one instance per thread). If that server dies,
+    it is replaced on the next document. Call ``close()`` (on the thread that
+    used it) or use the extractor as a context manager to shut it down; servers
+    still running at interpreter exit are quit from the main thread.
     """
     # Extensions are lowercase, no leading dot (as per spec)
     file_extensions: List[str] = ["docx", "docm", "doc", "rtf"]
+    # Word COM opens (and may lock) the file it is handed, so feed it a local copy
+    requires_local_copy = True
 
     def __init__(self, use_mammoth: bool = True, use_word_com: bool = True,
                  pandoc_path: str | None = None):
@@ -31,6 +96,37 @@ class WordFileTextExtractor(FileTextExtractor):
         self.use_mammoth  = use_mammoth
         self.use_word_com = use_word_com
         self.pandoc_path  = pandoc_path
+        # COM objects are apartment-bound, so each thread keeps its own Word instance
+        self._com_state = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """
+        Quit the Word COM server started by the calling thread (if any) and
+        release COM for that thread.
+        """
+        self._discard_word_app(warn=True)
+        if getattr(self._com_state, "com_initialized", False):
+            self._com_state.com_initialized = False
+            pythoncom.CoUninitialize()
+
+    def _discard_word_app(self, warn: bool = False):
+        """Quit (best effort) and forget this thread's Word server, keeping COM initialized."""
+        word = getattr(self._com_state, "word", None)
+        if word is None:
+            return
+        self._com_state.word = None
+        _unregister_word_server(self._com_state.token)
+        try:
+            word.Quit()
+        except Exception as e:
+            if warn:
+                logger.warning(f"Failed to quit Word COM server cleanly: {e}")
 
     def __call__(self, path: str) -> str:
         """
@@ -145,31 +241,65 @@ class WordFileTextExtractor(FileTextExtractor):
 
         raise RuntimeError(f"No viable method to extract text from legacy Word file on Windows:\n{path}")
 
+    def _get_word_app(self):
+        """
+        Return this thread's Word COM server, starting it on first use.
+        """
+        word = getattr(self._com_state, "word", None)
+        if word is None:
+            logger.debug("Starting Word COM server")
+            if not getattr(self._com_state, "com_initialized", False):
+                pythoncom.CoInitialize()
+                self._com_state.com_initialized = True
+            word = win32com.client.DispatchEx("Word.Application")
+            word.Visible = False
+            try:
+                word.DisplayAlerts = 0
+            except AttributeError:
+                pass
+            self._com_state.word = word
+            self._com_state.token = _register_word_server(word)
+        return word
+
+    def _open_document(self, path: str):
+        """
+        Open path read-only in this thread's Word server. If the cached server
+        has crashed or been killed (its proxy raises com_error), start a fresh
+        one and retry once.
+        """
+        open_args = dict(
+            ConfirmConversions=False,
+            ReadOnly=True,
+            AddToRecentFiles=False,
+            Visible=False,
+            Revert=False
+        )
+        full_path = str(Path(path).absolute())
+        try:
+            return self._get_word_app().Documents.Open(full_path, **open_args)
+        except pywintypes.com_error as e:
+            if e.hresult not in _COM_SERVER_GONE:
+                raise  # Word is alive; the document itself failed to open
+            logger.warning(f"Word COM server failed ({e}); restarting it")
+            self._discard_word_app()
+            return self._get_word_app().Documents.Open(full_path, **open_args)
+
     def _word_com_to_txt(self, path: str) -> str:
         """
         Use Microsoft Word via COM to SaveAs TXT, then read.
         """
         # Constants from Word Object Model (avoid importing win32com.constants each call)
         wdFormatText = 2
-        # Use the com_app context manager for CoInitialize/CoUninitialize
-        with com_app("Word.Application", visible=False) as word:
+        wdDoNotSaveChanges = 0
+        doc = self._open_document(path)
+        with tempfile.TemporaryDirectory() as td:
+            out_txt = Path(td) / (Path(path).stem + ".txt")
             try:
-                word.DisplayAlerts = 0
-            except AttributeError:
-                pass
-            doc = word.Documents.Open(
-                str(Path(path).absolute()),
-                ConfirmConversions=False,
-                ReadOnly=True,
-                AddToRecentFiles=False,
-                Visible=False,
-                Revert=False
-            )
-            with tempfile.TemporaryDirectory() as td:
-                out_txt = Path(td) / (Path(path).stem + ".txt")
                 doc.SaveAs2(str(out_txt), FileFormat=wdFormatText, Encoding=65001)
-                doc.Close()
-                return out_txt.read_text(encoding="utf-8", errors="ignore")
+            finally:
+                # only the document is closed; the Word server stays up for the next file
+                doc.Close(SaveChanges=wdDoNotSaveChanges)
+            return out_txt.read_text(encoding="utf-8", errors="ignore")
 
     def _pandoc_to_txt(self, path: str) -> str:
         """
@@ -381,6 +511,8 @@ class PresentationTextExtractor(FileTextExtractor):
     """
     # Extensions are lowercase, no leading dot (as per spec)
     file_extensions: List[str] = ["pptx", "pptm", "ppsx", "ppt", "pps", "odp"]
+    # PowerPoint COM / soffice conversions work on a local copy
+    requires_local_copy = True
 
     def __init__(self,
                  include_notes: bool = True,
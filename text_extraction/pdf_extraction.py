@@ -14,15 +14,21 @@ import io
 import ocrmypdf
 import os
 import shutil
+import stat
 import tempfile
+import threading
+import time
 
+from ocrmypdf.exceptions import SubprocessOutputError
 from pathlib import Path
 from typing import Union, List
 from .basic_extraction import FileTextExtractor
-from .extraction_utils import validate_file
 
 logger = logging.getLogger(__name__)
 
+# Concurrent OCR runs allowed by default (OCR_CONCURRENCY env var, else half the CPUs)
+DEFAULT_OCR_CONCURRENCY = int(os.environ.get('OCR_CONCURRENCY', max((os.cpu_count() or 2) // 2, 1)))
+
 class PDFFile:
     """
     Represents a PDF file and provides properties and utilities
@@ -63,7 +69,7 @@ class PDFFile:
 
         Parameters
         ----------
-        path : str
+        path : str | Path
             Path to the PDF file.
 
         Raises
@@ -74,13 +80,15 @@ class PDFFile:
             If the file cannot be opened as a PDF.
         """
         logger.debug(f"Initializing PDFFile for path: {path}")
-        self.path = Path(path)
-        # if the path doesn't exist or is not a file, raise an error
-        if not self.path.exists(): 
+        self.path = path if isinstance(path, Path) else Path(path)
+        # a single stat() answers existence, file type and size
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
             logger.error(f"PDF file not found: {self.path}")
             raise FileNotFoundError(f"PDF file not found: {path}")
 
-        if not self.path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.error(f"PDF path is not a file: {self.path}")
             raise FileNotFoundError(f"PDF file is not a file: {path}")
 
@@ -95,7 +103,7 @@ class PDFFile:
         logger.debug(f"PDFFile {self.path} has {self.page_count} pages; encrypted={self.is_encrypted}")
 
         self.name = self.path.stem
-        self.size = self.path.stat().st_size  # size in bytes
+        self.size = st.st_size  # size in bytes
         # cache for properties that are expensive to compute and not used much
         self.property_cache = {}
 
@@ -204,13 +212,46 @@ class PDFTextExtractor(FileTextExtractor):
         Parameters for OCR processing using ocrmypdf.
     max_stream_size : int
         Maximum file size (bytes) to process in memory before using a temp file.
+    ocr_probe_pages : int
+        Number of leading pages probed for a text layer before deciding on OCR.
+    ocr_retries : int
+        Number of OCR attempts for transient ocrmypdf failures.
     """
     # Extensions are lowercase, no leading dot (as per spec)
     file_extensions = ['pdf']
 
-    def __init__(self):
+    # cap on concurrent OCR runs shared by extractors without their own limit. A
+    # threading semaphore only bounds this process; multi-process callers (the
+    # add-files pipeline) install a cross-process one with use_shared_ocr_slots
+    _ocr_slots = threading.BoundedSemaphore(DEFAULT_OCR_CONCURRENCY)
+    # ocrmypdf 'jobs' per run; None means all but one CPU
+    _ocr_jobs = None
+
+    @classmethod
+    def use_shared_ocr_slots(cls, slots, limit: int):
+        """
+        Make extractors in this process draw OCR slots from a semaphore shared
+        across processes (e.g. multiprocessing.BoundedSemaphore created by the
+        parent), and split the CPUs between the ``limit`` concurrent OCR runs.
+
+        Call before constructing extractors, e.g. from a pool initializer.
+        """
+        cls._ocr_slots = slots
+        cls._ocr_jobs = max((os.cpu_count() or 1) // max(limit, 1), 1)
+
+    def __init__(self, ocr_concurrency: int | None = None, ocr_retries: int = 3):
         """
         Initialize PDFTextExtractor with default OCR parameters and stream-size threshold.
+
+        Parameters
+        ----------
+        ocr_concurrency : int | None
+            Maximum number of OCR runs this extractor allows at once. If None, the
+            shared limit is used: OCR_CONCURRENCY (default: half the CPU count) in
+            this process, or the cross-process one from use_shared_ocr_slots.
+        ocr_retries : int
+            Number of attempts for OCR runs that fail with an ocrmypdf subprocess
+            error, with exponential backoff between attempts.
         """
         super().__init__()
         self.ocr_params = {
@@ -219,7 +260,8 @@ class PDFTextExtractor(FileTextExtractor):
             'invalidate_digital_signatures': True,
             'skip_text': True,
             'language': 'eng',
-            'jobs': max(os.cpu_count() - 1, 1),  # Use all but one CPU core for OCR
+            # CPUs per OCR run: all but one, or a share of them when runs are capped
+            'jobs': self._ocr_jobs or max(os.cpu_count() - 1, 1),
             'optimize': 0,
             'output_type': 'pdf',
             'tesseract_timeout': 300,  # default timeout for Tesseract OCR
@@ -227,6 +269,14 @@ class PDFTextExtractor(FileTextExtractor):
 
         # threshold of files which cannot be processed in memory, default is 100 MB
         self.max_stream_size = 100 * 1024 * 1024
+
+        # number of leading pages checked for a text layer before committing to OCR
+        self.ocr_probe_pages = 3
+
+        self.ocr_retries = max(ocr_retries, 1)
+        if ocr_concurrency:
+            self._ocr_slots = threading.BoundedSemaphore(ocr_concurrency)
+            self.ocr_params['jobs'] = max((os.cpu_count() or 1) // ocr_concurrency, 1)
     
     @staticmethod
     def extract_text_with_ocr(pdf_path: Union[str, Path], ocr_params: dict) -> str:
@@ -273,9 +323,34 @@ class PDFTextExtractor(FileTextExtractor):
             with fitz.open(output_pdf_path) as doc:
                 return "".join(page.get_text() for page in doc)
     
+    def _ocr_with_retry(self, pdf_path: Union[str, Path], ocr_params: dict) -> str:
+        """
+        Run extract_text_with_ocr under the OCR concurrency limit, retrying
+        failed ocrmypdf subprocesses (SubprocessOutputError) with exponential
+        backoff. Tesseract timeouts never surface here: ocrmypdf handles
+        tesseract_timeout itself by skipping OCR on that page.
+        """
+        delay = 2
+        for attempt in range(1, self.ocr_retries + 1):
+            try:
+                with self._ocr_slots:
+                    return self.extract_text_with_ocr(pdf_path=pdf_path, ocr_params=ocr_params)
+            except SubprocessOutputError as e:
+                if attempt == self.ocr_retries:
+                    raise
+                logger.warning(f"OCR attempt {attempt}/{self.ocr_retries} failed for {pdf_path}: {e}; retrying in {delay}s")
+                time.sleep(delay)
+                delay = min(delay * 2, 30)
+
     def _fitz_doc_text(self, fitz_doc: fitz.Document, pdf_document: PDFFile) -> str:
         """
-        Extract text from a fitz.Document, with fallback to OCR if any page is blank.
+        Extract text from a fitz.Document, falling back to OCR for scanned documents.
+
+        The decision is made in two phases: the first ``ocr_probe_pages`` pages are
+        probed for font resources and then for text. If none of them has fonts or
+        text the document is treated as scanned and sent straight to OCR without
+        touching the remaining pages; otherwise the rest of the pages are extracted. OCR is still used if the
+        full text turns out to be shorter than the minimum useful length.
 
         Parameters
         ----------
@@ -291,15 +366,26 @@ class PDFTextExtractor(FileTextExtractor):
         """
         logger.debug(f"Extracting text with fitz for document: {pdf_document.path}")
         ocr_needed_length_threshold = 100 # if found text is less than this, trigger OCR
-        pdf_text = ""
-        for _, page in enumerate(fitz_doc):
-            page_text = page.get_text()
-            pdf_text += page_text
-        
-        if len(pdf_text) >= ocr_needed_length_threshold:
-            logger.debug(f"Extracted text length {len(pdf_text)}.")
-            return pdf_text
-        
+        page_count = fitz_doc.page_count
+        probe_count = min(self.ocr_probe_pages, page_count)
+
+        # phase 1: probe the leading pages. Pages without any font resources cannot
+        # carry a text layer, so that cheap check decides image-only documents
+        # without parsing page content.
+        has_fonts = any(fitz_doc.get_page_fonts(i) for i in range(probe_count))
+        page_texts = [fitz_doc[i].get_text() for i in range(probe_count)] if has_fonts else []
+        if any(t.strip() for t in page_texts):
+            # phase 2: text layer present, extract the remaining pages
+            page_texts.extend(fitz_doc[i].get_text() for i in range(probe_count, page_count))
+            pdf_text = "".join(page_texts)
+            if len(pdf_text) >= ocr_needed_length_threshold:
+                logger.debug(f"Extracted text length {len(pdf_text)}.")
+                return pdf_text
+        elif not has_fonts:
+            logger.debug(f"No font resources on the first {probe_count} pages of {pdf_document.path}")
+        else:
+            logger.debug(f"No text on the first {probe_count} pages of {pdf_document.path}")
+
         logger.info(f"OCR needed for document: {pdf_document.path}")
         ocr_params = self.ocr_params.copy()
         # if no timeout param in ocr_params, set a default based on page count
@@ -310,7 +396,7 @@ class PDFTextExtractor(FileTextExtractor):
         if not ocr_params.get('max_image_mpixels', None):
             ocr_params['max_image_mpixels'] = 1000 if pdf_document.has_large_format else 300
 
-        pdf_text = self.extract_text_with_ocr(pdf_path=pdf_document.path, ocr_params=ocr_params)
+        pdf_text = self._ocr_with_retry(pdf_path=pdf_document.path, ocr_params=ocr_params)
         return pdf_text
 
     def __call__(self, pdf_filepath: str) -> str:
@@ -333,10 +419,8 @@ class PDFTextExtractor(FileTextExtractor):
         doc = None
         extracted_text = ""
         try:
-            validated = validate_file(pdf_filepath)
-            # Log validated path
-            logger.debug(f"__call__: validated file path {validated}")
-            pdf = PDFFile(validated)
+            # PDFFile performs the existence / regular-file check with a single stat()
+            pdf = PDFFile(pdf_filepath)
             # Log PDF metadata
             logger.debug(f"__call__: PDF metadata size={pdf.size}, pages={pdf.page_count}, encrypted={pdf.is_encrypted}")
 
@@ -363,7 +447,7 @@ class PDFTextExtractor(FileTextExtractor):
                     doc.close()
         
         except Exception as e:
-            logger.error(f"Error extracting text from PDF {pdf.name}: {e}")
+            logger.error(f"Error extracting text from PDF {pdf_filepath}: {e}")
             raise e
 
         finally:
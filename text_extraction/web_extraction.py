@@ -30,6 +30,8 @@ class HtmlTextExtractor(FileTextExtractor):
     -------
     __call__(path: str) -> str
         Extract text content from the given HTML or MHTML file.
+    from_bytes(data, filename: str) -> str
+        Extract text content from the raw bytes of an HTML or MHTML file.
     _extract_from_mhtml(path: Path) -> str
         Extract HTML content from an MHTML file.
     """
@@ -72,12 +74,31 @@ class HtmlTextExtractor(FileTextExtractor):
         p = validate_file(path)
         logger.debug(f"Validated HTML file path: {p}")
 
-        ext = p.suffix.lower().lstrip(".")
+        return self.from_bytes(p.read_bytes(), p.name)
+
+    def from_bytes(self, data, filename: str) -> str:
+        """
+        Extract text content from the raw bytes of an HTML or MHTML file.
+
+        Parameters
+        ----------
+        data : bytes-like
+            File contents (bytes, memoryview or a read-only mmap).
+        filename : str
+            Original filename; its extension selects MHTML handling.
+
+        Returns
+        -------
+        str
+            Extracted text content.
+        """
+        ext = Path(filename).suffix.lower().lstrip(".")
         logger.debug(f"HTML file extension detected: {ext}")
         if ext in ("mhtml", "mht"):
-            html = self._extract_from_mhtml(p)
+            html = self._html_from_mhtml_message(
+                email.message_from_bytes(bytes(data), policy=policy.default))
         else:
-            html = p.read_text(errors="ignore", encoding="utf-8")
+            html = str(data, "utf-8", "ignore")
 
         # use shared HTML stripping utility
         return strip_html(html, parser=self.parser)
@@ -102,6 +123,11 @@ class HtmlTextExtractor(FileTextExtractor):
         """
         with open(path, "rb") as f:
             msg = email.message_from_binary_file(f, policy=policy.default)
+        return self._html_from_mhtml_message(msg)
+
+    @staticmethod
+    def _html_from_mhtml_message(msg) -> str:
+        """Return the first text/html part of a parsed MHTML message, or ''."""
         # Find the first text/html part
         for part in msg.walk():
             if part.get_content_type() == "text/html":
@@ -125,6 +151,8 @@ class EmailTextExtractor(FileTextExtractor):
     -------
     __call__(path: str) -> str
         Extract text content from the given email file.
+    from_bytes(data, filename: str) -> str
+        Extract text content from the raw bytes of an email file.
     """
     # Extensions are lowercase, no leading dot (as per spec)
     file_extensions: List[str] = ["eml", "msg"]
@@ -163,12 +191,31 @@ class EmailTextExtractor(FileTextExtractor):
         """
         logger.info(f"Extracting text from email file: {path}")
         # validate file
-        from .extraction_utils import validate_file, strip_html, normalize_whitespace
+        from .extraction_utils import validate_file
         p = validate_file(path)
         logger.debug(f"Validated email file path: {p}")
 
-        with open(p, "rb") as f:
-            msg = email.message_from_binary_file(f, policy=policy.default)
+        return self.from_bytes(p.read_bytes(), p.name)
+
+    def from_bytes(self, data, filename: str) -> str:
+        """
+        Extract text content from the raw bytes of an email file.
+
+        Parameters
+        ----------
+        data : bytes-like
+            File contents (bytes, memoryview or a read-only mmap).
+        filename : str
+            Original filename (used for logging only).
+
+        Returns
+        -------
+        str
+            Extracted text content from the email.
+        """
+        from .extraction_utils import strip_html, normalize_whitespace
+        logger.debug(f"Parsing email bytes for: {filename}")
+        msg = email.message_from_bytes(bytes(data), policy=policy.default)
 
         text_parts = []
         for part in msg.walk():